@@ -6,6 +6,17 @@ import streamlit as st
 import config
 
 
+# Option lists are built once at import as sorted, de-duplicated tuples so
+# they are not rebuilt (and re-hashed by Streamlit) on every rerun
+STATE_OPTIONS = tuple(sorted(set(config.INDIAN_STATES)))
+
+# Placeholder - in production, load from data
+COUNTRY_OPTIONS = tuple(sorted({
+    'USA', 'IND', 'CHN', 'BRA', 'NGA', 'IDN', 'PAK', 'BGD',
+    'RUS', 'MEX', 'JPN', 'DEU', 'GBR', 'FRA', 'ITA', 'ZAF'
+}))
+
+
 def create_filters():
     """
     Create filter controls and return filter values
@@ -64,10 +75,12 @@ def create_state_filter():
     )
     
     if filter_type == "Select Specific":
+        # st.multiselect already filters its options as the user types
         states = st.multiselect(
             "Select states",
-            options=config.INDIAN_STATES,
+            options=STATE_OPTIONS,
             default=[],
+            key='state_select',
             label_visibility="collapsed"
         )
         return states if states else None
@@ -80,12 +93,6 @@ def create_country_filter():
     
     st.markdown("#### 🌍 Countries")
     
-    # Placeholder - in production, load from data
-    common_countries = [
-        'USA', 'IND', 'CHN', 'BRA', 'NGA', 'IDN', 'PAK', 'BGD',
-        'RUS', 'MEX', 'JPN', 'DEU', 'GBR', 'FRA', 'ITA', 'ZAF'
-    ]
-    
     filter_type = st.radio(
         "Country Filter",
         options=["All Countries", "Select Specific"],
@@ -95,10 +102,12 @@ def create_country_filter():
     )
     
     if filter_type == "Select Specific":
+        # st.multiselect already filters its options as the user types
         countries = st.multiselect(
             "Select countries",
-            options=common_countries,
+            options=COUNTRY_OPTIONS,
             default=[],
+            key='country_select',
             label_visibility="collapsed"
         )
         return countries if countries else None
@@ -14,39 +14,32 @@ def render_kpi_cards(kpi_data):
         kpi_data (dict): Dictionary with KPI values
     """
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        render_metric_card(
-            label="Global Avg Poverty",
-            value=f"{kpi_data.get('global_avg', 0):.2f}%",
-            delta=f"{kpi_data.get('global_change', 0):.2f}%",
-            delta_color="inverse",
-            help_text="Average global poverty rate (latest year)"
-        )
-    
-    with col2:
-        render_metric_card(
-            label="India Avg Poverty",
-            value=f"{kpi_data.get('india_avg', 0):.2f}%",
-            delta=f"{kpi_data.get('india_change', 0):.2f}%",
-            delta_color="inverse",
-            help_text="Average India poverty rate (latest year)"
-        )
-    
-    with col3:
-        render_metric_card(
-            label="Countries Tracked",
-            value=str(kpi_data.get('total_countries', 0)),
-            help_text="Total number of countries in dataset"
-        )
+    # Bind each KPI once, then render the cards from a single table
+    global_avg = kpi_data.get('global_avg', 0)
+    global_change = kpi_data.get('global_change', 0)
+    india_avg = kpi_data.get('india_avg', 0)
+    india_change = kpi_data.get('india_change', 0)
+    
+    cards = (
+        ("Global Avg Poverty", f"{global_avg:.2f}%", f"{global_change:.2f}%", "inverse",
+         "Average global poverty rate (latest year)"),
+        ("India Avg Poverty", f"{india_avg:.2f}%", f"{india_change:.2f}%", "inverse",
+         "Average India poverty rate (latest year)"),
+        ("Countries Tracked", str(kpi_data.get('total_countries', 0)), None, "normal",
+         "Total number of countries in dataset"),
+        ("Indian States", str(kpi_data.get('total_states', 0)), None, "normal",
+         "Total number of Indian states/territories"),
+    )
     
-    with col4:
-        render_metric_card(
-            label="Indian States",
-            value=str(kpi_data.get('total_states', 0)),
-            help_text="Total number of Indian states/territories"
-        )
+    for col, (label, value, delta, delta_color, help_text) in zip(st.columns(len(cards)), cards):
+        with col:
+            render_metric_card(
+                label=label,
+                value=value,
+                delta=delta,
+                delta_color=delta_color,
+                help_text=help_text
+            )
 
 
 def render_metric_card(label, value, delta=None, delta_color="normal", help_text=None):
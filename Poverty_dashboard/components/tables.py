@@ -2,8 +2,15 @@
 Table Components - Styled data tables
 """
 
+import io
 import streamlit as st
 import pandas as pd
+import numpy as np
+import config
+
+
+# Statistics shown per aggregated column in render_summary_table
+SUMMARY_STATS = ('mean', 'median', 'min', 'max', 'std')
 
 
 def render_data_table(data, title=None, height=400):
@@ -45,8 +52,32 @@ def render_styled_table(data, title=None, color_column=None, highlight_max=True)
         st.info("No data available")
         return
     
+    st.dataframe(
+        _styled_table(data, color_column, highlight_max),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
+def _styled_table(data, color_column=None, highlight_max=True):
+    """
+    Build the conditionally formatted Styler for a table
+    
+    The Styler only records the styling steps; st.dataframe applies them
+    when it serializes the table, keeping the interactive widget.
+    
+    Args:
+        data (pd.DataFrame): Data to display
+        color_column (str): Column to apply color gradient
+        highlight_max (bool): Whether to highlight maximum values
+    
+    Returns:
+        pandas.io.formats.style.Styler: Styled table
+    """
+    
     # Create styled dataframe
     styled_df = data.style
+    numeric_cols = _numeric_columns(data)
     
     # Apply gradient to numeric columns
     if color_column and color_column in data.columns:
@@ -58,19 +89,40 @@ def render_styled_table(data, title=None, color_column=None, highlight_max=True)
         )
     elif highlight_max:
         # Apply gradient to all numeric columns
-        numeric_cols = data.select_dtypes(include=['float64', 'int64']).columns
-        if len(numeric_cols) > 0:
+        if numeric_cols:
             styled_df = styled_df.background_gradient(
-                subset=numeric_cols.tolist(),
+                subset=numeric_cols,
                 cmap='RdYlGn_r'
             )
     
-    # Format numeric columns
-    numeric_cols = data.select_dtypes(include=['float64', 'int64']).columns
-    format_dict = {col: '{:.2f}' for col in numeric_cols}
-    styled_df = styled_df.format(format_dict, na_rep='-')
+    # Format numeric columns with one shared format string; missing values
+    # in every column (numeric or not) render as '-'
+    styled_df = styled_df.format(na_rep='-')
+    if numeric_cols:
+        styled_df = styled_df.format('{:.2f}', subset=numeric_cols, na_rep='-')
     
-    st.dataframe(styled_df, use_container_width=True, hide_index=True)
+    return styled_df
+
+
+def _numeric_columns(data):
+    """
+    Numeric column names of a frame
+    
+    Uses the list clean_data records in data.attrs when present (restricted
+    to columns still in the frame), otherwise falls back to select_dtypes.
+    
+    Args:
+        data (pd.DataFrame): Input data
+    
+    Returns:
+        list: Numeric column names
+    """
+    
+    recorded = [col for col in data.attrs.get('numeric_cols', ()) if col in data.columns]
+    if recorded:
+        return recorded
+    
+    return data.select_dtypes(include=[np.number]).columns.tolist()
 
 
 def render_comparison_table(data1, data2, labels=None, title=None):
@@ -117,13 +169,12 @@ def render_pivot_table(data, index, columns, values, aggfunc='mean', title=None)
         st.markdown(f"### {title}")
     
     try:
-        pivot = pd.pivot_table(
-            data,
-            index=index,
-            columns=columns,
-            values=values,
-            aggfunc=aggfunc,
-            fill_value=0
+        # groupby + unstack is the pivot itself, without pivot_table's
+        # generic multi-aggfunc machinery
+        pivot = (
+            data.groupby([index, columns], observed=True)[values]
+            .agg(aggfunc)
+            .unstack(fill_value=0)
         )
         
         st.dataframe(
@@ -150,8 +201,14 @@ def render_summary_table(data, group_by, agg_cols, title=None):
         st.markdown(f"### {title}")
     
     try:
-        summary = data.groupby(group_by)[agg_cols].agg(['mean', 'median', 'min', 'max', 'std'])
-        summary = summary.round(2)
+        # Each statistic runs once over the whole column block (one cython
+        # kernel per statistic) instead of once per column per statistic
+        grouped = data.groupby(group_by, observed=True)[agg_cols]
+        summary = pd.concat(
+            {stat: getattr(grouped, stat)() for stat in SUMMARY_STATS},
+            axis=1
+        ).swaplevel(axis=1)
+        summary = summary[pd.MultiIndex.from_product([agg_cols, SUMMARY_STATS])].round(2)
         
         st.dataframe(summary, use_container_width=True)
     
@@ -175,10 +232,40 @@ def render_downloadable_table(data, filename="data", title=None):
     st.dataframe(data, use_container_width=True, hide_index=True)
     
     # Download button
-    csv = data.to_csv(index=False)
     st.download_button(
         label="📥 Download as CSV",
-        data=csv,
+        data=csv_bytes(data),
         file_name=f"{filename}.csv",
         mime="text/csv"
     )
+
+
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def csv_bytes(data):
+    """
+    Serialize a DataFrame, or several combined, to UTF-8 CSV bytes
+    
+    Cached, so reruns with the same data reuse the bytes instead of
+    serializing again. A dict of frames is written one frame after another
+    into one byte buffer against the union of their columns (aligned as
+    pd.concat would) plus a 'source' column holding each frame's key,
+    without materializing the combined frame.
+    
+    Args:
+        data (pd.DataFrame or dict): Frame, or source key -> DataFrame
+    
+    Returns:
+        bytes: CSV payload without the index
+    """
+    
+    if isinstance(data, pd.DataFrame):
+        return data.to_csv(index=False).encode('utf-8')
+    
+    output = io.BytesIO()
+    columns = list(dict.fromkeys(col for df in data.values() for col in [*df.columns, 'source']))
+    for i, (key, df) in enumerate(data.items()):
+        df.assign(source=key).reindex(columns=columns).to_csv(
+            output, index=False, header=(i == 0), encoding='utf-8'
+        )
+    
+    return output.getvalue()
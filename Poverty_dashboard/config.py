@@ -3,6 +3,12 @@ Configuration file for Poverty Dashboard
 Contains constants, settings, and indicator lists
 """
 
+import os
+
+# Directory containing this file (the app root), for paths that must not
+# depend on the working directory
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Application metadata
 APP_TITLE = "Poverty Dashboard"
 APP_ICON = "📊"
@@ -12,6 +18,9 @@ APP_VERSION = "1.0.0"
 CACHE_TTL = 3600  # Cache time-to-live in seconds (1 hour)
 DATA_START_YEAR = 2000
 DATA_END_YEAR = 2024
+DISK_CACHE_DIR = os.path.join(APP_DIR, ".cache")  # Parquet cache that survives restarts
+DISK_CACHE_TTL = 86400  # Disk cache time-to-live in seconds (1 day)
+DISK_CACHE_VERSION = 3  # Bump when cached frame layout changes to invalidate old files
 
 # World Bank API settings (placeholders)
 WB_API_BASE_URL = "https://api.worldbank.org/v2"
@@ -33,7 +42,7 @@ INDIA_POVERTY_INDICATORS = [
 ]
 
 # Indian states
-INDIAN_STATES = [
+INDIAN_STATES = (
     "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
     "Goa", "Gujarat", "Haryana", "Himachal Pradesh", "Jharkhand",
     "Karnataka", "Kerala", "Madhya Pradesh", "Maharashtra", "Manipur",
@@ -42,10 +51,10 @@ INDIAN_STATES = [
     "Uttar Pradesh", "Uttarakhand", "West Bengal", "Delhi", "Jammu & Kashmir",
     "Ladakh", "Puducherry", "Chandigarh", "Dadra & Nagar Haveli and Daman & Diu",
     "Lakshadweep", "Andaman & Nicobar Islands"
-]
+)
 
 # Area types
-AREA_TYPES = ["All", "Rural", "Urban"]
+AREA_TYPES = ("All", "Rural", "Urban")
 
 # Chart color schemes
 COLOR_SCHEME = {
@@ -64,15 +73,22 @@ MAP_CENTER_LAT = 20.5937
 MAP_CENTER_LON = 78.9629
 MAP_ZOOM = 4
 
+# Chart rendering settings
+SCATTER_DENSITY_THRESHOLD = 50_000  # Above this many points scatter plots are binned server-side
+SCATTER_DENSITY_BINS = 200  # Bins per axis for the binned scatter
+
 # Export settings
 EXPORT_DIR = "reports/exports"
 GENERATED_DIR = "reports/generated"
 
 # Machine Learning settings
-ML_MODELS = ["Linear Regression", "Random Forest", "Gradient Boosting"]
+ML_MODELS = ("Linear Regression", "Random Forest", "Gradient Boosting")
 ML_TEST_SIZE = 0.2
 ML_RANDOM_STATE = 42
+ML_SEARCH_ITERATIONS = 10  # Parameter combinations sampled by hyperparameter_tuning
+ML_HIST_GB_MIN_ROWS = 10_000  # 'Gradient Boosting' uses histogram boosting from this many rows
+ML_PARALLEL_PREDICT_MIN_ROWS = 10_000  # Ensemble members predict in parallel from this many rows
 
 # Statistical analysis settings
-CORRELATION_METHODS = ["pearson", "spearman", "kendall"]
+CORRELATION_METHODS = ("pearson", "spearman", "kendall")
 CONFIDENCE_LEVEL = 0.95
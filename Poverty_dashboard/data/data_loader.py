@@ -3,10 +3,16 @@ Unified Data Loading and Caching
 Central module for loading all data sources
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from .wb_api import fetch_wb_poverty_data, fetch_wb_country_metadata, fetch_all_wb_indicators
 from .india_poverty_api import fetch_india_poverty_data, fetch_india_multi_indicator_data, fetch_state_demographics
+from .preprocess import clean_data
+from .disk_cache import parquet_cache
 import config
 
 
@@ -44,6 +50,84 @@ def load_data(data_type, **kwargs):
     return loaders[data_type](**kwargs)
 
 
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=32, show_spinner=False)
+@parquet_cache
+def load_clean_data(data_type, **kwargs):
+    """
+    Load a dataset and run clean_data on it, caching the cleaned result
+    
+    Pages that always clean what they load use this so reruns skip both
+    the load and the cleaning pass. The cleaned frame is also persisted as
+    Parquet (categorical and Arrow string dtypes included), so a cold
+    start reads it back instead of regenerating and re-cleaning.
+    
+    Args:
+        data_type (str): Type of data to load (see load_data)
+        **kwargs: Additional arguments passed to load_data
+    
+    Returns:
+        pd.DataFrame: Cleaned data
+    """
+    
+    df = clean_data(load_data(data_type, **kwargs))
+    
+    # Remaining free-text columns become Arrow-backed strings, which
+    # st.dataframe serializes without a per-cell object conversion. Numeric
+    # columns stay NumPy-backed for the stats/ML code.
+    if isinstance(df, pd.DataFrame):
+        object_cols = df.select_dtypes(include='object').columns
+        if len(object_cols):
+            df = df.astype({col: 'string[pyarrow]' for col in object_cols})
+    
+    return df
+
+
+def with_country_names(df, metadata=None):
+    """
+    Add a country_name column looked up from country metadata
+    
+    Loaders return ISO-3 codes only; call this where display names are
+    needed. The lookup runs once per distinct country (categorical codes are
+    reused), and countries missing from the metadata get "Country <code>".
+    
+    Args:
+        df (pd.DataFrame): Data with a 'country' column of ISO-3 codes
+        metadata (pd.DataFrame): Country metadata with 'country_code' and
+            'name' columns (defaults to load_data('wb_metadata'))
+    
+    Returns:
+        pd.DataFrame: Copy of df with a categorical 'country_name' column
+    """
+    
+    if df is None or df.empty or 'country' not in df.columns:
+        return df
+    
+    if metadata is None:
+        metadata = load_data('wb_metadata')
+    
+    names = dict(zip(metadata['country_code'], metadata['name']))
+    country = df['country'].astype('category')
+    labels = [names.get(code, f"Country {code}") for code in country.cat.categories]
+    
+    return df.assign(country_name=pd.Categorical.from_codes(country.cat.codes, categories=labels))
+
+
+@st.cache_resource(ttl=config.CACHE_TTL, show_spinner=False)
+def wb_metadata_by_code():
+    """
+    Country metadata indexed by ISO-3 code, for joins on a 'country' column
+    
+    Kept as a shared resource so the index (and its hash table) is built once
+    rather than on every merge; treat the returned frame as read-only.
+    
+    Returns:
+        pd.DataFrame: Metadata with [name, region, income_level], indexed by
+            country_code
+    """
+    
+    return load_data('wb_metadata').set_index('country_code')
+
+
 @st.cache_data(ttl=config.CACHE_TTL)
 def get_cached_data(cache_key):
     """
@@ -65,7 +149,29 @@ def clear_cache():
     st.cache_data.clear()
 
 
-@st.cache_data(ttl=config.CACHE_TTL)
+def canonical_filter_args(filters=None):
+    """
+    Reduce a filters dict to hashable cache-key arguments
+    
+    Args:
+        filters (dict): Filter parameters
+            - year_range: (start, end)
+            - states: list of states
+            - countries: list of countries
+    
+    Returns:
+        tuple: (year_range, states, countries) as tuples of primitives
+    """
+    
+    filters = filters or {}
+    
+    return (
+        tuple(filters.get('year_range') or (config.DATA_START_YEAR, config.DATA_END_YEAR)),
+        tuple(filters.get('states') or ()),
+        tuple(filters.get('countries') or ()),
+    )
+
+
 def load_combined_dataset(filters=None):
     """
     Load and combine all datasets based on filters
@@ -75,51 +181,76 @@ def load_combined_dataset(filters=None):
             - year_range: (start, end)
             - states: list of states
             - countries: list of countries
-            - indicators: list of indicators
     
     Returns:
         dict: Combined datasets
     """
     
-    filters = filters or {}
+    # Equivalent dicts (None vs [] states, list vs tuple years) share a cache entry
+    return _load_combined_dataset(*canonical_filter_args(filters))
+
+
+@st.cache_data(ttl=config.CACHE_TTL)
+def _load_combined_dataset(year_range, states, countries):
+    """
+    Load and combine all datasets for canonical filter arguments
     
-    # Extract filter parameters
-    year_range = filters.get('year_range', (config.DATA_START_YEAR, config.DATA_END_YEAR))
-    states = filters.get('states', None)
-    countries = filters.get('countries', None)
+    Args:
+        year_range (tuple): (start, end)
+        states (tuple): States to include (empty for all)
+        countries (tuple): Country codes to include (empty for all)
     
-    datasets = {}
+    Returns:
+        dict: Combined datasets
+    """
     
-    # Load World Bank data
-    datasets['wb_poverty'] = load_data(
-        'wb_poverty',
-        indicator_code='SI.POV.DDAY',
-        start_year=year_range[0],
-        end_year=year_range[1],
-        countries=countries
-    )
+    # Empty selections mean "all", matching the loaders' None default
+    states = states or None
+    countries = countries or None
     
-    # Load India data
-    datasets['india_poverty'] = load_data(
-        'india_poverty',
-        start_year=year_range[0],
-        end_year=year_range[1],
-        states=states
-    )
+    # The loaders are independent, so run them concurrently. Worker threads
+    # inherit the script context so st.cache_data behaves as on the main thread
+    ctx = get_script_run_ctx()
     
-    # Load metadata
-    datasets['wb_metadata'] = load_data('wb_metadata')
-    datasets['india_demographics'] = load_data('india_demographics')
+    with ThreadPoolExecutor(
+        max_workers=4,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        futures = {
+            # World Bank data
+            'wb_poverty': executor.submit(
+                load_data,
+                'wb_poverty',
+                indicator_code='SI.POV.DDAY',
+                start_year=year_range[0],
+                end_year=year_range[1],
+                countries=countries
+            ),
+            # India data
+            'india_poverty': executor.submit(
+                load_data,
+                'india_poverty',
+                start_year=year_range[0],
+                end_year=year_range[1],
+                states=states
+            ),
+            # Metadata
+            'wb_metadata': executor.submit(load_data, 'wb_metadata'),
+            'india_demographics': executor.submit(load_data, 'india_demographics'),
+        }
+        datasets = {key: future.result() for key, future in futures.items()}
     
     return datasets
 
 
-def get_data_summary(df):
+def get_data_summary(df, deep=False):
     """
     Get summary statistics for a dataframe
     
     Args:
         df (pd.DataFrame): Input dataframe
+        deep (bool): Introspect object columns for exact memory usage
+            (scans every cell of those columns)
     
     Returns:
         dict: Summary statistics
@@ -131,7 +262,7 @@ def get_data_summary(df):
     return {
         'row_count': len(df),
         'column_count': len(df.columns),
-        'memory_usage': df.memory_usage(deep=True).sum() / 1024**2,  # MB
-        'null_counts': df.isnull().sum().to_dict(),
+        'memory_usage': df.memory_usage(deep=deep).sum() / 1024**2,  # MB
+        'null_counts': df.isna().sum().to_dict(),
         'dtypes': df.dtypes.astype(str).to_dict(),
     }
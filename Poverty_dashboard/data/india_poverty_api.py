@@ -4,12 +4,34 @@ Placeholder functions for fetching India-specific poverty data
 Replace with actual API calls when endpoints are available
 """
 
+import zlib
 import pandas as pd
 import numpy as np
 import streamlit as st
 import config
+from .disk_cache import parquet_cache
+
+# Seed for the synthetic draws in this module. The stream id (2) keeps them
+# independent of the World Bank module's draws
+_SEED = (config.ML_RANDOM_STATE, 2)
+
+
+def _rng(*key):
+    """Per-call generator seeded from _SEED and the call's arguments (as data.wb_api._rng)"""
+    
+    entropy = [k if isinstance(k, (int, np.integer)) else zlib.crc32(str(k).encode()) for k in key]
+    
+    return np.random.default_rng([*_SEED, *entropy])
+
+
+# Categorical dtypes for the label columns, built once and shared by every frame
+_STATE_DT = pd.CategoricalDtype(config.INDIAN_STATES)
+_AREA_DT = pd.CategoricalDtype(('Rural', 'Urban'))
+_INDICATOR_DT = pd.CategoricalDtype(tuple(config.INDIA_POVERTY_INDICATORS))
+
 
 @st.cache_data(ttl=config.CACHE_TTL)
+@parquet_cache
 def fetch_india_poverty_data(indicator=None, start_year=None, end_year=None, states=None, area_type="All"):
     """
     Fetch India state-wise poverty data
@@ -30,46 +52,13 @@ def fetch_india_poverty_data(indicator=None, start_year=None, end_year=None, sta
         response = requests.get(url, params=params)
     """
     
-    start_year = start_year or config.DATA_START_YEAR
-    end_year = end_year or config.DATA_END_YEAR
-    states_list = states or config.INDIAN_STATES
     indicator = indicator or "Poverty Rate (%)"
     
-    years = list(range(start_year, end_year + 1))
-    data = []
-    
-    for state in states_list:
-        # Generate synthetic data with regional patterns
-        base_rural = np.random.uniform(15, 50)
-        base_urban = base_rural * np.random.uniform(0.3, 0.7)
-        trend = np.random.uniform(-0.8, -0.1)
-        
-        for i, year in enumerate(years):
-            if area_type in ["All", "Rural"]:
-                rural_value = base_rural + (trend * i) + np.random.normal(0, 3)
-                rural_value = max(0, min(100, rural_value))
-                
-                data.append({
-                    'state': state,
-                    'year': year,
-                    'area_type': 'Rural',
-                    'indicator': indicator,
-                    'value': round(rural_value, 2)
-                })
-            
-            if area_type in ["All", "Urban"]:
-                urban_value = base_urban + (trend * i) + np.random.normal(0, 2)
-                urban_value = max(0, min(100, urban_value))
-                
-                data.append({
-                    'state': state,
-                    'year': year,
-                    'area_type': 'Urban',
-                    'indicator': indicator,
-                    'value': round(urban_value, 2)
-                })
-    
-    return pd.DataFrame(data)
+    values, states_list, years, areas = _generate_india_block(
+        start_year, end_year, states, area_type, indicator=indicator
+    )
+    
+    return _build_india_frame(values, states_list, years, areas, [indicator])
 
 
 @st.cache_data(ttl=config.CACHE_TTL)
@@ -81,17 +70,102 @@ def fetch_india_multi_indicator_data(start_year=None, end_year=None):
         pd.DataFrame: Multi-indicator state-wise data
     """
     
-    all_data = []
+    values, states_list, years, areas = _generate_india_block(
+        start_year, end_year, n_blocks=len(config.INDIA_POVERTY_INDICATORS)
+    )
     
-    for indicator in config.INDIA_POVERTY_INDICATORS:
-        df = fetch_india_poverty_data(
-            indicator=indicator,
-            start_year=start_year,
-            end_year=end_year
-        )
-        all_data.append(df)
+    return _build_india_frame(values, states_list, years, areas, config.INDIA_POVERTY_INDICATORS)
+
+
+def _state_dtype(states_list):
+    """Shared state dtype, extended with any names not in config.INDIAN_STATES"""
     
-    return pd.concat(all_data, ignore_index=True)
+    unknown = [s for s in dict.fromkeys(states_list) if s not in _STATE_DT.categories]
+    
+    return pd.CategoricalDtype(list(config.INDIAN_STATES) + unknown) if unknown else _STATE_DT
+
+
+def _generate_india_block(start_year=None, end_year=None, states=None, area_type="All", n_blocks=1, indicator=None):
+    """
+    Generate synthetic state-wise values for one or more indicators
+    
+    Args:
+        start_year (int): Start year
+        end_year (int): End year
+        states (list): List of state names
+        area_type (str): 'All', 'Rural', or 'Urban'
+        n_blocks (int): Number of independent indicator blocks to draw
+        indicator (str): Indicator name, part of the seed so indicators differ
+    
+    Returns:
+        tuple: (values, states_list, years, areas) where values has shape
+            (n_blocks, n_states, n_years, n_areas)
+    """
+    
+    start_year = start_year or config.DATA_START_YEAR
+    end_year = end_year or config.DATA_END_YEAR
+    states_list = states or config.INDIAN_STATES
+    
+    years = np.arange(start_year, end_year + 1)
+    shape = (n_blocks, len(states_list))
+    rng = _rng(start_year, end_year, n_blocks, indicator, '|'.join(states_list))
+    
+    # Generate synthetic data with regional patterns, one draw per column
+    base_rural = rng.uniform(15, 50, shape)
+    base_urban = base_rural * rng.uniform(0.3, 0.7, shape)
+    trend = rng.uniform(-0.8, -0.1, shape)
+    drift = trend[..., None] * np.arange(len(years))
+    
+    areas = []
+    blocks = []
+    for area, base, noise_sd in (('Rural', base_rural, 3), ('Urban', base_urban, 2)):
+        if area_type in ["All", area]:
+            # Accumulate into the freshly drawn noise array instead of
+            # allocating a temporary per arithmetic step
+            block = rng.normal(0, noise_sd, drift.shape)
+            block += base[..., None]
+            block += drift
+            areas.append(area)
+            blocks.append(block)
+    
+    # Trailing area axis keeps the state -> year -> area row order
+    values = np.stack(blocks, axis=-1) if blocks else np.empty(drift.shape + (0,))
+    np.clip(values, 0, 100, out=values)
+    np.round(values, 2, out=values)
+    
+    return values, states_list, years, areas
+
+
+def _build_india_frame(values, states_list, years, areas, indicators):
+    """Assemble a long-format DataFrame from a generated value block"""
+    
+    n_blocks, n_states, n_years, n_areas = values.shape
+    block_rows = n_states * n_years * n_areas
+    
+    # Label columns are categorical: one small code per row instead of a string.
+    # Numeric columns are downcast: years fit int16 and the 2-decimal
+    # percentages fit float32, halving the cached/pickled frame size
+    state_dt = _state_dtype(states_list)
+    state_codes = state_dt.categories.get_indexer(states_list)
+    area_codes = _AREA_DT.categories.get_indexer(areas)
+    indicator_dt = _INDICATOR_DT if list(indicators) == list(_INDICATOR_DT.categories) else pd.CategoricalDtype(indicators)
+    
+    return pd.DataFrame({
+        'state': pd.Categorical.from_codes(
+            np.tile(np.repeat(state_codes, n_years * n_areas), n_blocks),
+            dtype=state_dt
+        ),
+        'year': np.tile(np.repeat(years.astype(np.int16), n_areas), n_states * n_blocks),
+        'area_type': pd.Categorical.from_codes(
+            np.tile(area_codes, n_states * n_years * n_blocks),
+            dtype=_AREA_DT
+        ),
+        'indicator': pd.Categorical.from_codes(
+            np.repeat(np.arange(n_blocks), block_rows),
+            dtype=indicator_dt
+        ),
+        'value': values.ravel().astype(np.float32),
+    })
 
 
 @st.cache_data(ttl=config.CACHE_TTL)
@@ -109,16 +183,22 @@ def fetch_state_demographics(state=None):
     """
     
     states_list = [state] if state else config.INDIAN_STATES
-    
-    data = []
-    for state_name in states_list:
-        data.append({
-            'state': state_name,
-            'population': np.random.randint(5_000_000, 200_000_000),
-            'rural_population_pct': round(np.random.uniform(30, 80), 2),
-            'urban_population_pct': round(np.random.uniform(20, 70), 2),
-            'literacy_rate': round(np.random.uniform(60, 95), 2),
-            'gdp_per_capita': round(np.random.uniform(50000, 300000), 2),
-        })
-    
-    return pd.DataFrame(data)
+    n_states = len(states_list)
+    
+    # One batched draw for all four continuous columns (per-column bounds
+    # broadcast across states), rounded once in place; population fits
+    # uint32 and percentages fit float32
+    low = np.array([30, 20, 60, 50000])
+    high = np.array([80, 70, 95, 300000])
+    rng = _rng('|'.join(states_list))
+    draws = rng.uniform(low, high, (n_states, len(low)))
+    np.round(draws, 2, out=draws)
+    
+    return pd.DataFrame({
+        'state': pd.Categorical(states_list, dtype=_state_dtype(states_list)),
+        'population': rng.integers(5_000_000, 200_000_000, n_states, dtype=np.uint32),
+        'rural_population_pct': draws[:, 0].astype(np.float32),
+        'urban_population_pct': draws[:, 1].astype(np.float32),
+        'literacy_rate': draws[:, 2].astype(np.float32),
+        'gdp_per_capita': draws[:, 3],
+    })
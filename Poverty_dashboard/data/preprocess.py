@@ -8,6 +8,13 @@ import numpy as np
 from typing import List, Optional, Tuple
 
 
+# Low-cardinality label columns kept as categoricals so groupby/pivot/isin
+# work on integer codes rather than hashing strings
+LABEL_COLUMNS = (
+    'country', 'country_name', 'state', 'area_type', 'indicator', 'region', 'income_level'
+)
+
+
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and standardize dataframe
@@ -22,35 +29,56 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return df
     
-    df_clean = df.copy()
-    
-    # Remove duplicates
-    df_clean = df_clean.drop_duplicates()
+    # Remove duplicates (returns a new frame, so the caller's df is untouched)
+    df_clean = df.drop_duplicates()
     
-    # Handle missing values in numeric columns
+    # Handle missing values in numeric columns: one median per column,
+    # filled in a single block assignment
     numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        # Fill with median for numeric columns
-        if df_clean[col].isnull().any():
-            df_clean[col].fillna(df_clean[col].median(), inplace=True)
+    if len(numeric_cols):
+        df_clean[numeric_cols] = df_clean[numeric_cols].fillna(df_clean[numeric_cols].median())
     
     # Handle missing values in categorical columns
     categorical_cols = df_clean.select_dtypes(include=['object']).columns
-    for col in categorical_cols:
-        if df_clean[col].isnull().any():
-            df_clean[col].fillna('Unknown', inplace=True)
+    if len(categorical_cols):
+        df_clean[categorical_cols] = df_clean[categorical_cols].fillna('Unknown')
+    
+    # Label columns are category dtype: 'Unknown' has to be a category before
+    # it can fill them, and is added only where something is missing so
+    # complete columns keep their shared dtype
+    for col in df_clean.select_dtypes(include=['category']).columns:
+        labels = df_clean[col]
+        if labels.isna().any():
+            if 'Unknown' not in labels.cat.categories:
+                labels = labels.cat.add_categories('Unknown')
+            df_clean[col] = labels.fillna('Unknown')
     
     # Remove outliers using IQR method for 'value' column if exists
+    # (values are NaN-free after the median fill, so plain np.percentile
+    # takes both quartiles in one partition of the raw ndarray)
     if 'value' in df_clean.columns:
-        Q1 = df_clean['value'].quantile(0.25)
-        Q3 = df_clean['value'].quantile(0.75)
+        values = df_clean['value'].to_numpy()
+        Q1, Q3 = np.percentile(values, [25, 75])
         IQR = Q3 - Q1
         lower_bound = Q1 - 3 * IQR
         upper_bound = Q3 + 3 * IQR
-        df_clean = df_clean[
-            (df_clean['value'] >= lower_bound) & 
-            (df_clean['value'] <= upper_bound)
-        ]
+        df_clean = df_clean[(values >= lower_bound) & (values <= upper_bound)]
+    
+    # Loaders already return categorical labels; this covers frames that
+    # arrive with plain string columns
+    for col in LABEL_COLUMNS:
+        if col in df_clean.columns and df_clean[col].dtype == object:
+            df_clean[col] = df_clean[col].astype('category')
+    
+    # Same for the numeric columns: percentages fit float32 and years int16,
+    # halving the bytes every groupby/corr/fit has to stream through
+    if 'value' in df_clean.columns and df_clean['value'].dtype == np.float64:
+        df_clean['value'] = pd.to_numeric(df_clean['value'], downcast='float')
+    if 'year' in df_clean.columns and pd.api.types.is_integer_dtype(df_clean['year']):
+        df_clean['year'] = pd.to_numeric(df_clean['year'], downcast='integer')
+    
+    # Remember the numeric columns so display helpers can skip select_dtypes
+    df_clean.attrs['numeric_cols'] = tuple(numeric_cols)
     
     return df_clean
 
@@ -81,32 +109,32 @@ def filter_data(
     if df is None or df.empty:
         return df
     
-    df_filtered = df.copy()
+    # Conditions are AND-ed into one boolean mask and the frame is indexed
+    # once, instead of materializing an intermediate frame per filter
+    mask = np.ones(len(df), dtype=bool)
     
     # Filter by year range
-    if year_range and 'year' in df_filtered.columns:
-        df_filtered = df_filtered[
-            (df_filtered['year'] >= year_range[0]) & 
-            (df_filtered['year'] <= year_range[1])
-        ]
+    if year_range and 'year' in df.columns:
+        years = df['year'].to_numpy()
+        mask &= (years >= year_range[0]) & (years <= year_range[1])
     
     # Filter by states
-    if states and 'state' in df_filtered.columns:
-        df_filtered = df_filtered[df_filtered['state'].isin(states)]
+    if states and 'state' in df.columns:
+        mask &= df['state'].isin(states).to_numpy()
     
     # Filter by countries
-    if countries and 'country' in df_filtered.columns:
-        df_filtered = df_filtered[df_filtered['country'].isin(countries)]
+    if countries and 'country' in df.columns:
+        mask &= df['country'].isin(countries).to_numpy()
     
     # Filter by area type
-    if area_type and area_type != "All" and 'area_type' in df_filtered.columns:
-        df_filtered = df_filtered[df_filtered['area_type'] == area_type]
+    if area_type and area_type != "All" and 'area_type' in df.columns:
+        mask &= (df['area_type'] == area_type).to_numpy()
     
     # Filter by indicators
-    if indicators and 'indicator' in df_filtered.columns:
-        df_filtered = df_filtered[df_filtered['indicator'].isin(indicators)]
+    if indicators and 'indicator' in df.columns:
+        mask &= df['indicator'].isin(indicators).to_numpy()
     
-    return df_filtered
+    return df if mask.all() else df[mask]
 
 
 def transform_data(df: pd.DataFrame, transformation: str = 'none') -> pd.DataFrame:
@@ -129,27 +157,38 @@ def transform_data(df: pd.DataFrame, transformation: str = 'none') -> pd.DataFra
     if df is None or df.empty or 'value' not in df.columns:
         return df
     
-    df_transformed = df.copy()
+    if transformation not in ('log', 'sqrt', 'normalize', 'standardize'):
+        return df
+    
+    # The transform runs in place on one private copy of the value array
+    # (float32 stays float32), so each branch allocates no temporaries;
+    # assign() then swaps in only that column
+    values = df['value']
+    arr = values.to_numpy(dtype=values.dtype if values.dtype.kind == 'f' else np.float64, copy=True)
     
     if transformation == 'log':
-        df_transformed['value'] = np.log1p(df_transformed['value'])
+        np.log1p(arr, out=arr)
     
     elif transformation == 'sqrt':
-        df_transformed['value'] = np.sqrt(df_transformed['value'])
+        np.sqrt(arr, out=arr)
     
     elif transformation == 'normalize':
-        min_val = df_transformed['value'].min()
-        max_val = df_transformed['value'].max()
-        if max_val > min_val:
-            df_transformed['value'] = (df_transformed['value'] - min_val) / (max_val - min_val)
+        min_val = values.min()
+        max_val = values.max()
+        if not max_val > min_val:
+            return df
+        arr -= min_val
+        arr /= max_val - min_val
     
     elif transformation == 'standardize':
-        mean_val = df_transformed['value'].mean()
-        std_val = df_transformed['value'].std()
-        if std_val > 0:
-            df_transformed['value'] = (df_transformed['value'] - mean_val) / std_val
-    
-    return df_transformed
+        mean_val = values.mean()
+        std_val = values.std()
+        if not std_val > 0:
+            return df
+        arr -= mean_val
+        arr /= std_val
+    
+    return df.assign(value=arr)
 
 
 def aggregate_data(
@@ -177,15 +216,17 @@ def aggregate_data(
     if not valid_cols:
         return df
     
-    # Find numeric columns to aggregate
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    # Find numeric columns to aggregate (group keys such as 'year' stay keys)
+    numeric_cols = [
+        col for col in df.select_dtypes(include=[np.number]).columns
+        if col not in valid_cols
+    ]
     
     if not numeric_cols:
         return df
     
-    agg_dict = {col: agg_func for col in numeric_cols}
-    
-    df_agg = df.groupby(valid_cols, as_index=False).agg(agg_dict)
+    # One reduction over the numeric block instead of a per-column dict
+    df_agg = df.groupby(valid_cols, as_index=False, observed=True)[numeric_cols].agg(agg_func)
     
     return df_agg
 
@@ -217,24 +258,64 @@ def pivot_data(
         return df
     
     try:
-        df_pivot = df.pivot_table(
-            index=index,
-            columns=columns,
-            values=values,
-            aggfunc='mean'
-        )
+        df_pivot = df.groupby([index, columns], observed=True)[values].mean().unstack()
         return df_pivot.reset_index()
     except Exception:
         return df
 
 
-def calculate_growth_rate(df: pd.DataFrame, value_col: str = 'value') -> pd.DataFrame:
+def latest_year_slice(df: pd.DataFrame) -> Tuple[Optional[int], pd.DataFrame]:
+    """
+    Extract the rows for the most recent year
+    
+    Args:
+        df (pd.DataFrame): Input data with a 'year' column
+    
+    Returns:
+        tuple: (latest_year, rows for that year); (None, df) if df is empty
+    """
+    
+    if df is None or df.empty:
+        return None, df
+    
+    years = df['year'].to_numpy()
+    latest_year = int(years.max())
+    return latest_year, df[years == latest_year]
+
+
+def sorted_labels(series: pd.Series) -> List[str]:
+    """
+    Sorted distinct labels present in a column
+    
+    For categorical columns this reads the categories actually in use
+    (a unique over the integer codes) instead of hashing every row.
+    
+    Args:
+        series (pd.Series): Label column
+    
+    Returns:
+        list: Sorted distinct labels
+    """
+    
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return sorted(series.cat.remove_unused_categories().cat.categories)
+    
+    return sorted(series.dropna().unique())
+
+
+def calculate_growth_rate(
+    df: pd.DataFrame,
+    value_col: str = 'value',
+    group_keys: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
     Calculate year-over-year growth rate
     
     Args:
         df (pd.DataFrame): Input data with 'year' column
         value_col (str): Column to calculate growth for
+        group_keys (list): Columns identifying one series (default: the
+            label columns present, e.g. country/state/area_type/indicator)
     
     Returns:
         pd.DataFrame: Data with growth_rate column
@@ -243,12 +324,21 @@ def calculate_growth_rate(df: pd.DataFrame, value_col: str = 'value') -> pd.Data
     if df is None or df.empty or 'year' not in df.columns or value_col not in df.columns:
         return df
     
-    df_growth = df.copy()
-    df_growth = df_growth.sort_values('year')
+    if group_keys is None:
+        group_keys = [col for col in LABEL_COLUMNS if col in df.columns]
+    
+    df_growth = df.sort_values('year')
+    
+    # Group on integer category codes rather than hashing object labels
+    for col in group_keys:
+        if df_growth[col].dtype == object:
+            df_growth[col] = df_growth[col].astype('category')
     
-    # Calculate percentage change
-    df_growth['growth_rate'] = df_growth.groupby(
-        [col for col in df.columns if col not in ['year', value_col, 'growth_rate']]
-    )[value_col].pct_change() * 100
+    # Calculate percentage change within each series
+    if group_keys:
+        values = df_growth.groupby(group_keys, sort=False, observed=True)[value_col]
+    else:
+        values = df_growth[value_col]
+    df_growth['growth_rate'] = values.pct_change() * 100
     
     return df_growth
@@ -4,10 +4,11 @@ Statistical Analysis Page - Advanced analytics, correlation, regression
 
 import streamlit as st
 import pandas as pd
-from data.data_loader import load_data
-from data.preprocess import clean_data
+import numpy as np
+from data.data_loader import load_data, with_country_names
+from data.cached_loaders import get_wb_poverty, get_india_poverty, get_india_multi_indicator, get_yearly_mean
+from data.preprocess import latest_year_slice
 from utils.stats import calculate_correlation, perform_regression, get_summary_statistics
-from utils.ml import train_model, predict_future, evaluate_model
 from utils.visualization import create_scatter_plot, create_heatmap
 import config
 
@@ -40,6 +41,64 @@ def render(filters):
         render_ml_predictions(filters)
 
 
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _cached_indicator_pivot(india_data):
+    """
+    State-year x indicator matrix of mean values
+    
+    Rural/Urban rows are averaged; groupby + unstack skips pivot_table's
+    generic aggregation machinery. Independent of the correlation method,
+    so switching methods reuses it.
+    """
+    return (
+        india_data.groupby(['state', 'year', 'indicator'], observed=True)['value']
+        .mean()
+        .unstack('indicator')
+    )
+
+
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _cached_correlation(pivot_data, method):
+    """Correlation matrix, reused across reruns for unchanged inputs"""
+    return calculate_correlation(pivot_data, method=method)
+
+
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _cached_regression(X, y):
+    """OLS fit and metrics, reused across reruns for unchanged inputs"""
+    return perform_regression(X, y)
+
+
+@st.cache_resource(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _cached_training(model_type, data_source, year_range):
+    """
+    Train a yearly-average model for a data source and year range
+    
+    Cached as a resource: the fitted estimator is shared rather than
+    pickled per rerun, and changing only the forecast horizon reuses it.
+    
+    Returns:
+        tuple: (model, metrics, predictions, data_agg)
+    """
+    
+    # sklearn-backed; imported only when a model is actually trained
+    from utils.ml import train_model
+    
+    # Prepare features
+    data_agg = get_yearly_mean('wb_poverty' if data_source == "Global" else 'india_poverty', year_range)
+    if data_agg.empty:
+        return None, {}, pd.DataFrame(), data_agg
+    
+    model, metrics, predictions = train_model(
+        data_agg,
+        target='value',
+        features=['year'],
+        model_type=model_type
+    )
+    
+    return model, metrics, predictions, data_agg
+
+
 def render_summary_statistics(filters):
     """Render summary statistics"""
     
@@ -51,20 +110,9 @@ def render_summary_statistics(filters):
     # Load data
     with st.spinner("Loading data..."):
         if data_source == "Global":
-            data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = with_country_names(get_wb_poverty(filters['year_range']))
         else:
-            data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-    
-    data = clean_data(data)
+            data = get_india_poverty(filters['year_range'])
     
     if data.empty:
         st.warning("No data available")
@@ -101,7 +149,7 @@ def render_summary_statistics(filters):
         group_cols = ['state']
     
     if all(col in data.columns for col in group_cols):
-        detailed_stats = data.groupby(group_cols)['value'].describe().round(2)
+        detailed_stats = data.groupby(group_cols, observed=True, sort=False)['value'].describe().round(2)
         st.dataframe(detailed_stats, use_container_width=True)
     
     # Distribution info
@@ -129,23 +177,14 @@ def render_correlation_analysis(filters):
     
     # Load multi-indicator data
     with st.spinner("Loading indicator data..."):
-        india_data = load_data('india_multi_indicator', 
-                              start_year=filters['year_range'][0],
-                              end_year=filters['year_range'][1])
-    
-    india_data = clean_data(india_data)
+        india_data = get_india_multi_indicator(filters['year_range'])
     
     if india_data.empty:
         st.warning("No data available")
         return
     
-    # Pivot data for correlation analysis
-    pivot_data = india_data.pivot_table(
-        index=['state', 'year'],
-        columns='indicator',
-        values='value',
-        aggfunc='mean'
-    )
+    # Pivot data for correlation analysis (cached apart from the method choice)
+    pivot_data = _cached_indicator_pivot(india_data)
     
     # Correlation method selection
     corr_method = st.selectbox(
@@ -155,7 +194,7 @@ def render_correlation_analysis(filters):
     )
     
     # Calculate correlation
-    correlation_matrix = calculate_correlation(pivot_data, method=corr_method)
+    correlation_matrix = _cached_correlation(pivot_data, corr_method)
     
     # Display correlation heatmap
     st.markdown("#### Correlation Heatmap")
@@ -174,16 +213,13 @@ def render_correlation_analysis(filters):
     st.markdown("#### Key Insights")
     
     # Find strongest correlations
-    corr_pairs = []
-    for i in range(len(correlation_matrix.columns)):
-        for j in range(i+1, len(correlation_matrix.columns)):
-            corr_pairs.append({
-                'Indicator 1': correlation_matrix.columns[i],
-                'Indicator 2': correlation_matrix.columns[j],
-                'Correlation': correlation_matrix.iloc[i, j]
-            })
-    
-    corr_df = pd.DataFrame(corr_pairs).sort_values('Correlation', key=abs, ascending=False)
+    cols = correlation_matrix.columns.to_numpy()
+    i, j = np.triu_indices(len(cols), k=1)
+    corr_df = pd.DataFrame({
+        'Indicator 1': cols[i],
+        'Indicator 2': cols[j],
+        'Correlation': correlation_matrix.to_numpy()[i, j]
+    }).sort_values('Correlation', key=np.abs, ascending=False)
     
     st.markdown("**Strongest Positive Correlations:**")
     st.dataframe(corr_df.head(5), use_container_width=True, hide_index=True)
@@ -201,20 +237,15 @@ def render_regression_analysis(filters):
     
     # Load data
     with st.spinner("Loading data..."):
-        india_data = load_data('india_multi_indicator',
-                              start_year=filters['year_range'][0],
-                              end_year=filters['year_range'][1])
+        india_data = get_india_multi_indicator(filters['year_range'])
         demographics = load_data('india_demographics')
     
-    india_data = clean_data(india_data)
-    
     if india_data.empty:
         st.warning("No data available")
         return
     
     # Prepare data for regression
-    latest_year = india_data['year'].max()
-    latest_data = india_data[india_data['year'] == latest_year]
+    _, latest_data = latest_year_slice(india_data)
     
     # Pivot to get poverty rate
     poverty_data = latest_data[latest_data['indicator'] == 'Poverty Rate (%)'].copy()
@@ -238,10 +269,13 @@ def render_regression_analysis(filters):
         return
     
     # Perform regression
-    X = poverty_data[independent_vars].fillna(poverty_data[independent_vars].median())
+    # Select the columns once and fill gaps from one median pass; dtypes are
+    # left as loaded (gdp_per_capita needs float64 for its two decimals)
+    X_raw = poverty_data[independent_vars]
+    X = X_raw.fillna(X_raw.median(numeric_only=True))
     y = poverty_data[dependent_var]
     
-    regression_results = perform_regression(X, y)
+    regression_results = _cached_regression(X, y)
     
     # Display results
     st.markdown("#### Regression Results")
@@ -259,10 +293,11 @@ def render_regression_analysis(filters):
     
     # Coefficients
     st.markdown("#### Regression Coefficients")
+    coefficients = np.asarray(regression_results['coefficients'])
     coef_df = pd.DataFrame({
         'Variable': independent_vars,
-        'Coefficient': regression_results['coefficients'],
-        'Interpretation': [f"{'Positive' if c > 0 else 'Negative'} relationship" for c in regression_results['coefficients']]
+        'Coefficient': coefficients,
+        'Interpretation': np.where(coefficients > 0, 'Positive relationship', 'Negative relationship')
     })
     st.dataframe(coef_df, use_container_width=True, hide_index=True)
     
@@ -297,40 +332,18 @@ def render_ml_predictions(filters):
     # Data source
     data_source = st.radio("Data Source", ["Global", "India"], horizontal=True, key='ml_source')
     
-    # Load data
-    with st.spinner("Loading data..."):
-        if data_source == "Global":
-            data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-        else:
-            data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-    
-    data = clean_data(data)
+    # Load data and train (cached, so the prediction slider does not retrain)
+    with st.spinner(f"Training {model_type} model..."):
+        model, metrics, predictions, data_agg = _cached_training(
+            model_type,
+            data_source,
+            tuple(filters['year_range'])
+        )
     
-    if data.empty:
+    if data_agg.empty:
         st.warning("No data available")
         return
     
-    # Prepare features
-    data_agg = data.groupby('year')['value'].mean().reset_index()
-    
-    # Train model
-    with st.spinner(f"Training {model_type} model..."):
-        model, metrics, predictions = train_model(
-            data_agg,
-            target='value',
-            features=['year'],
-            model_type=model_type
-        )
-    
     # Display metrics
     st.markdown("#### Model Performance")
     
@@ -353,6 +366,8 @@ def render_ml_predictions(filters):
     
     years_ahead = st.slider("Years to predict ahead", 1, 10, 5)
     
+    from utils.ml import predict_future
+    
     future_predictions = predict_future(model, data_agg, years_ahead=years_ahead)
     
     # Combine historical and predictions
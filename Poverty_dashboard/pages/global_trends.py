@@ -4,8 +4,8 @@ Global Trends Page - Worldwide poverty indicators visualization
 
 import streamlit as st
 import pandas as pd
-from data.data_loader import load_data
-from data.preprocess import clean_data, filter_data
+from data.data_loader import load_data, with_country_names, wb_metadata_by_code
+from data.preprocess import clean_data, filter_data, latest_year_slice
 from utils.visualization import create_line_chart, create_bar_chart, create_choropleth_map
 import config
 
@@ -35,23 +35,12 @@ def render(filters):
     
     # Load data
     with st.spinner("Loading global data..."):
-        wb_data = load_data(
-            'wb_poverty',
-            indicator_code=selected_indicator,
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1]
-        )
-        wb_metadata = load_data('wb_metadata')
-    
-    wb_data = clean_data(wb_data)
+        wb_data = _global_frame(selected_indicator, filters['year_range'])
     
     if wb_data.empty:
         st.warning("No data available for selected filters")
         return
     
-    # Merge with metadata
-    wb_data = wb_data.merge(wb_metadata, left_on='country', right_on='country_code', how='left')
-    
     st.markdown("---")
     
     # Render based on view type
@@ -68,20 +57,48 @@ def render(filters):
     
     col1, col2, col3, col4 = st.columns(4)
     
-    latest_year = wb_data['year'].max()
-    latest_data = wb_data[wb_data['year'] == latest_year]
+    # One latest-year slice and one aggregation feed all four metrics
+    _, latest_data = latest_year_slice(wb_data)
+    latest = latest_data['value'].agg(['mean', 'max', 'min'])
     
     with col1:
         st.metric("Countries Tracked", wb_data['country'].nunique())
     
     with col2:
-        st.metric("Average Poverty Rate", f"{latest_data['value'].mean():.2f}%")
+        st.metric("Average Poverty Rate", f"{latest['mean']:.2f}%")
     
     with col3:
-        st.metric("Highest Rate", f"{latest_data['value'].max():.2f}%")
+        st.metric("Highest Rate", f"{latest['max']:.2f}%")
     
     with col4:
-        st.metric("Lowest Rate", f"{latest_data['value'].min():.2f}%")
+        st.metric("Lowest Rate", f"{latest['min']:.2f}%")
+
+
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _global_frame(indicator_code, year_range):
+    """
+    Cleaned World Bank data for one indicator, with names and metadata
+    
+    Args:
+        indicator_code (str): World Bank indicator code
+        year_range (tuple): (start_year, end_year)
+    
+    Returns:
+        pd.DataFrame: Cleaned data joined with country metadata
+    """
+    
+    wb_data = clean_data(with_country_names(load_data(
+        'wb_poverty',
+        indicator_code=indicator_code,
+        start_year=year_range[0],
+        end_year=year_range[1]
+    )))
+    
+    if wb_data.empty:
+        return wb_data
+    
+    # Merge with metadata
+    return wb_data.join(wb_metadata_by_code(), on='country', how='left')
 
 
 def render_time_series_view(wb_data, indicator):
@@ -140,7 +157,7 @@ def render_regional_comparison(wb_data, indicator):
     st.subheader("🗺️ Regional Poverty Comparison")
     
     # Aggregate by region and year
-    regional_data = wb_data.groupby(['region', 'year'])['value'].mean().reset_index()
+    regional_data = wb_data.groupby(['region', 'year'], observed=True)['value'].mean().reset_index()
     
     # Create area chart for regions
     fig = create_line_chart(
@@ -173,7 +190,7 @@ def render_regional_comparison(wb_data, indicator):
     
     # Regional statistics table
     with st.expander("📋 Regional Statistics"):
-        regional_stats = wb_data.groupby('region')['value'].agg(['mean', 'min', 'max', 'std']).round(2)
+        regional_stats = wb_data.groupby('region', observed=True)['value'].agg(['mean', 'min', 'max', 'std']).round(2)
         regional_stats.columns = ['Average', 'Minimum', 'Maximum', 'Std Dev']
         st.dataframe(regional_stats, use_container_width=True)
 
@@ -209,7 +226,8 @@ def render_country_ranking(wb_data, indicator):
     
     with col2:
         st.markdown("#### 🟢 Top 10 Lowest Poverty Rates")
-        lowest = year_data.tail(10).sort_values('value', ascending=True)
+        # The frame is already sorted descending; reverse its last 10 rows
+        lowest = year_data.iloc[:-11:-1]
         fig_low = create_bar_chart(
             lowest,
             x='country_name',
@@ -2,52 +2,14 @@
 Learn More Page - Project information, methodology, and data sources
 """
 
+import textwrap
+
 import streamlit as st
 import config
 
 
-def render():
-    """Render the learn more page"""
-    
-    st.title("📚 Learn More")
-    st.markdown("Information about the Poverty Dashboard project, methodology, and data sources")
-    st.markdown("---")
-    
-    # Create tabs for different sections
-    tabs = st.tabs([
-        "About",
-        "Methodology",
-        "Data Sources",
-        "Indicators",
-        "FAQ",
-        "Contact"
-    ])
-    
-    with tabs[0]:
-        render_about()
-    
-    with tabs[1]:
-        render_methodology()
-    
-    with tabs[2]:
-        render_data_sources()
-    
-    with tabs[3]:
-        render_indicators()
-    
-    with tabs[4]:
-        render_faq()
-    
-    with tabs[5]:
-        render_contact()
-
-
-def render_about():
-    """Render about section"""
-    
-    st.subheader("📊 About the Poverty Dashboard")
-    
-    st.markdown("""
+# Static section text, formatted once at import rather than on every rerun
+_ABOUT_MD = """
     The **Poverty Dashboard** is a comprehensive data visualization and analysis platform designed to provide
     insights into poverty trends across the globe with a special focus on India.
     
@@ -75,18 +37,12 @@ def render_about():
     - **Last Updated**: 2024
     - **Data Coverage**: {start_year} - {end_year}
     """.format(
-        version=config.APP_VERSION,
-        start_year=config.DATA_START_YEAR,
-        end_year=config.DATA_END_YEAR
-    ))
-
+    version=config.APP_VERSION,
+    start_year=config.DATA_START_YEAR,
+    end_year=config.DATA_END_YEAR
+)
 
-def render_methodology():
-    """Render methodology section"""
-    
-    st.subheader("🔬 Methodology")
-    
-    st.markdown("""
+_METHODOLOGY_MD = """
     ### Data Collection
     
     The dashboard integrates data from multiple authoritative sources:
@@ -150,15 +106,9 @@ def render_methodology():
     - Cross-validation of statistical models
     - Comparison with published reports
     - Regular data updates and verification
-    """)
-
+    """
 
-def render_data_sources():
-    """Render data sources section"""
-    
-    st.subheader("📚 Data Sources")
-    
-    st.markdown("""
+_DATA_SOURCES_MD = """
     ### Primary Data Sources
     
     #### 1. World Bank Open Data
@@ -221,178 +171,142 @@ def render_data_sources():
     - India government APIs: Ready for integration
     
     Replace the placeholder functions in `data/wb_api.py` and `data/india_poverty_api.py` with actual API calls.
-    """.format(wb_api=config.WB_API_BASE_URL))
+    """.format(wb_api=config.WB_API_BASE_URL)
 
-
-def render_indicators():
-    """Render indicators section"""
+_INDIA_INDICATOR_DESCRIPTIONS = {
+    "Poverty Rate (%)": """
+    **Description**: Percentage of population living below the poverty line
     
-    st.subheader("📊 Poverty Indicators")
+    **Measurement**: Based on consumption expenditure surveys
     
-    st.markdown("### World Bank Indicators")
+    **Categories**:
+    - Rural poverty rate
+    - Urban poverty rate
+    - Combined poverty rate
+    """,
     
-    # Display WB indicators
-    for indicator in config.WB_POVERTY_INDICATORS:
-        with st.expander(f"📌 {indicator['name']}"):
-            st.markdown(f"""
-            **Indicator Code**: `{indicator['code']}`
-            
-            **Description**: This indicator measures {indicator['name'].lower()}.
-            
-            **Interpretation**:
-            - Higher values indicate higher poverty rates
-            - Used for international comparisons
-            - Adjusted for purchasing power parity (PPP)
-            """)
+    "Multidimensional Poverty Index (MPI)": """
+    **Description**: Measures poverty across multiple dimensions beyond income
     
-    st.markdown("---")
-    st.markdown("### India Poverty Indicators")
+    **Dimensions**:
+    - Health (nutrition, child mortality)
+    - Education (years of schooling, school attendance)
+    - Living Standards (cooking fuel, sanitation, drinking water, electricity, housing, assets)
     
-    # Display India indicators
-    for indicator in config.INDIA_POVERTY_INDICATORS:
-        with st.expander(f"📌 {indicator}"):
-            description = get_indicator_description(indicator)
-            st.markdown(description)
-
-
-def get_indicator_description(indicator):
-    """Get description for India indicators"""
+    **Range**: 0 to 1 (higher values indicate higher poverty)
+    """,
     
-    descriptions = {
-        "Poverty Rate (%)": """
-        **Description**: Percentage of population living below the poverty line
-        
-        **Measurement**: Based on consumption expenditure surveys
-        
-        **Categories**:
-        - Rural poverty rate
-        - Urban poverty rate
-        - Combined poverty rate
-        """,
-        
-        "Multidimensional Poverty Index (MPI)": """
-        **Description**: Measures poverty across multiple dimensions beyond income
-        
-        **Dimensions**:
-        - Health (nutrition, child mortality)
-        - Education (years of schooling, school attendance)
-        - Living Standards (cooking fuel, sanitation, drinking water, electricity, housing, assets)
-        
-        **Range**: 0 to 1 (higher values indicate higher poverty)
-        """,
-        
-        "Per Capita Income (₹)": """
-        **Description**: Average income per person in Indian Rupees
-        
-        **Use**: Economic indicator of prosperity
-        
-        **Note**: Adjusted for inflation in constant prices
-        """,
-        
-        "Unemployment Rate (%)": """
-        **Description**: Percentage of labor force that is unemployed
+    "Per Capita Income (₹)": """
+    **Description**: Average income per person in Indian Rupees
+    
+    **Use**: Economic indicator of prosperity
+    
+    **Note**: Adjusted for inflation in constant prices
+    """,
+    
+    "Unemployment Rate (%)": """
+    **Description**: Percentage of labor force that is unemployed
+    
+    **Measurement**: Based on labor force surveys
+    
+    **Significance**: Linked to poverty and economic wellbeing
+    """,
+    
+    "Literacy Rate (%)": """
+    **Description**: Percentage of population (age 7+) who can read and write
+    
+    **Significance**: Education is strongly correlated with poverty reduction
+    
+    **Trend**: Generally improving across India
+    """
+}
+
+_WB_INDICATOR_SECTIONS = tuple(
+    (
+        f"📌 {indicator['name']}",
+        f"""
+        **Indicator Code**: `{indicator['code']}`
         
-        **Measurement**: Based on labor force surveys
+        **Description**: This indicator measures {indicator['name'].lower()}.
         
-        **Significance**: Linked to poverty and economic wellbeing
-        """,
+        **Interpretation**:
+        - Higher values indicate higher poverty rates
+        - Used for international comparisons
+        - Adjusted for purchasing power parity (PPP)
+        """
+    )
+    for indicator in config.WB_POVERTY_INDICATORS
+)
+
+_FAQS = [
+    {
+        "question": "What is the poverty line?",
+        "answer": """
+        The poverty line is a threshold income level below which a person or household is considered poor.
+        Different countries and organizations use different poverty lines. The World Bank uses international
+        poverty lines of $2.15, $3.65, and $6.85 per day (2017 PPP), while India uses its own national
+        poverty line based on consumption expenditure.
+        """
+    },
+    {
+        "question": "How often is the data updated?",
+        "answer": """
+        Data update frequency varies by source:
+        - World Bank indicators: Annual updates
+        - India state-wise data: Updated based on NSSO surveys (periodic)
+        - The dashboard cache is refreshed hourly
         
-        "Literacy Rate (%)": """
-        **Description**: Percentage of population (age 7+) who can read and write
+        Note: Official poverty data typically has a 2-3 year lag due to data collection and processing time.
+        """
+    },
+    {
+        "question": "Why is rural poverty higher than urban poverty?",
+        "answer": """
+        Rural poverty is generally higher due to:
+        - Limited access to economic opportunities
+        - Lower wages in agricultural sector
+        - Limited access to education and healthcare
+        - Infrastructure challenges
+        - Seasonal employment patterns
         
-        **Significance**: Education is strongly correlated with poverty reduction
+        However, the gap is narrowing in many regions due to rural development programs and migration.
+        """
+    },
+    {
+        "question": "How accurate are the ML predictions?",
+        "answer": """
+        Machine learning predictions should be interpreted with caution:
+        - Models are trained on historical data
+        - Accuracy metrics (R², RMSE) are shown for each model
+        - Predictions assume historical trends continue
+        - External shocks (pandemics, policy changes) can affect actual outcomes
         
-        **Trend**: Generally improving across India
+        Use predictions as indicative trends, not absolute forecasts.
+        """
+    },
+    {
+        "question": "Can I use this data for research?",
+        "answer": """
+        Yes, with proper attribution:
+        - Cite the original data sources (World Bank, Government of India)
+        - Cite this dashboard if using processed/analyzed data
+        - Follow open data licenses for each dataset
+        - Verify data accuracy for critical research
+        """
+    },
+    {
+        "question": "How do I report data issues?",
+        "answer": """
+        If you notice any data inconsistencies:
+        1. Check the data source documentation
+        2. Verify filters and selections
+        3. Contact us through the Contact section
+        4. Provide specific details (indicator, year, location)
         """
     }
-    
-    return descriptions.get(indicator, f"**{indicator}**\n\nDetailed description coming soon.")
+]
 
-
-def render_faq():
-    """Render FAQ section"""
-    
-    st.subheader("❓ Frequently Asked Questions")
-    
-    faqs = [
-        {
-            "question": "What is the poverty line?",
-            "answer": """
-            The poverty line is a threshold income level below which a person or household is considered poor.
-            Different countries and organizations use different poverty lines. The World Bank uses international
-            poverty lines of $2.15, $3.65, and $6.85 per day (2017 PPP), while India uses its own national
-            poverty line based on consumption expenditure.
-            """
-        },
-        {
-            "question": "How often is the data updated?",
-            "answer": """
-            Data update frequency varies by source:
-            - World Bank indicators: Annual updates
-            - India state-wise data: Updated based on NSSO surveys (periodic)
-            - The dashboard cache is refreshed hourly
-            
-            Note: Official poverty data typically has a 2-3 year lag due to data collection and processing time.
-            """
-        },
-        {
-            "question": "Why is rural poverty higher than urban poverty?",
-            "answer": """
-            Rural poverty is generally higher due to:
-            - Limited access to economic opportunities
-            - Lower wages in agricultural sector
-            - Limited access to education and healthcare
-            - Infrastructure challenges
-            - Seasonal employment patterns
-            
-            However, the gap is narrowing in many regions due to rural development programs and migration.
-            """
-        },
-        {
-            "question": "How accurate are the ML predictions?",
-            "answer": """
-            Machine learning predictions should be interpreted with caution:
-            - Models are trained on historical data
-            - Accuracy metrics (R², RMSE) are shown for each model
-            - Predictions assume historical trends continue
-            - External shocks (pandemics, policy changes) can affect actual outcomes
-            
-            Use predictions as indicative trends, not absolute forecasts.
-            """
-        },
-        {
-            "question": "Can I use this data for research?",
-            "answer": """
-            Yes, with proper attribution:
-            - Cite the original data sources (World Bank, Government of India)
-            - Cite this dashboard if using processed/analyzed data
-            - Follow open data licenses for each dataset
-            - Verify data accuracy for critical research
-            """
-        },
-        {
-            "question": "How do I report data issues?",
-            "answer": """
-            If you notice any data inconsistencies:
-            1. Check the data source documentation
-            2. Verify filters and selections
-            3. Contact us through the Contact section
-            4. Provide specific details (indicator, year, location)
-            """
-        }
-    ]
-    
-    for i, faq in enumerate(faqs, 1):
-        with st.expander(f"**{i}. {faq['question']}**"):
-            st.markdown(faq['answer'])
-
-
-def render_contact():
-    """Render contact section"""
-    
-    st.subheader("📧 Contact & Support")
-    
-    st.markdown("""
+_CONTACT_MD = """
     ### Get in Touch
     
     We welcome your feedback, questions, and suggestions!
@@ -441,7 +355,140 @@ def render_contact():
     - Government of India for official statistics
     - Open source community for tools and libraries
     - All contributors to this project
-    """)
+    """
+
+
+def _details_html(sections):
+    """
+    Join (title, markdown body) pairs into collapsible <details> blocks
+    
+    One st.markdown call renders the whole list, instead of one
+    st.expander component per entry.
+    
+    Args:
+        sections (iterable): (title, markdown body) tuples
+    
+    Returns:
+        str: HTML/markdown for st.markdown(..., unsafe_allow_html=True)
+    """
+    
+    # Blank lines around the body let the markdown inside <details> render
+    return "\n\n".join(
+        f"<details><summary><b>{title}</b></summary>\n\n{textwrap.dedent(body).strip()}\n\n</details>"
+        for title, body in sections
+    )
+
+
+def render():
+    """Render the learn more page"""
+    
+    st.title("📚 Learn More")
+    st.markdown("Information about the Poverty Dashboard project, methodology, and data sources")
+    st.markdown("---")
+    
+    # Create tabs for different sections
+    tabs = st.tabs([
+        "About",
+        "Methodology",
+        "Data Sources",
+        "Indicators",
+        "FAQ",
+        "Contact"
+    ])
+    
+    with tabs[0]:
+        render_about()
+    
+    with tabs[1]:
+        render_methodology()
+    
+    with tabs[2]:
+        render_data_sources()
+    
+    with tabs[3]:
+        render_indicators()
+    
+    with tabs[4]:
+        render_faq()
+    
+    with tabs[5]:
+        render_contact()
+
+
+def render_about():
+    """Render about section"""
+    
+    st.subheader("📊 About the Poverty Dashboard")
+    
+    st.markdown(_ABOUT_MD)
+
+
+def render_methodology():
+    """Render methodology section"""
+    
+    st.subheader("🔬 Methodology")
+    
+    st.markdown(_METHODOLOGY_MD)
+
+
+def render_data_sources():
+    """Render data sources section"""
+    
+    st.subheader("📚 Data Sources")
+    
+    st.markdown(_DATA_SOURCES_MD)
+
+
+def render_indicators():
+    """Render indicators section"""
+    
+    st.subheader("📊 Poverty Indicators")
+    
+    st.markdown("### World Bank Indicators")
+    
+    # Display WB indicators
+    st.markdown(_WB_INDICATORS_HTML, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    st.markdown("### India Poverty Indicators")
+    
+    # Display India indicators
+    st.markdown(_INDIA_INDICATORS_HTML, unsafe_allow_html=True)
+
+
+def get_indicator_description(indicator):
+    """Get description for India indicators"""
+    
+    return _INDIA_INDICATOR_DESCRIPTIONS.get(indicator, f"**{indicator}**\n\nDetailed description coming soon.")
+
+
+_WB_INDICATORS_HTML = _details_html(_WB_INDICATOR_SECTIONS)
+
+_INDIA_INDICATORS_HTML = _details_html(
+    (f"📌 {indicator}", get_indicator_description(indicator))
+    for indicator in config.INDIA_POVERTY_INDICATORS
+)
+
+_FAQ_HTML = _details_html(
+    (f"{i}. {faq['question']}", faq['answer'])
+    for i, faq in enumerate(_FAQS, 1)
+)
+
+
+def render_faq():
+    """Render FAQ section"""
+    
+    st.subheader("❓ Frequently Asked Questions")
+    
+    st.markdown(_FAQ_HTML, unsafe_allow_html=True)
+
+
+def render_contact():
+    """Render contact section"""
+    
+    st.subheader("📧 Contact & Support")
+    
+    st.markdown(_CONTACT_MD)
     
     # Feedback form
     st.markdown("---")
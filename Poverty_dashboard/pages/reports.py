@@ -2,12 +2,17 @@
 Reports Page - Data downloads and PDF generation
 """
 
+import io
+import zipfile
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+import xlsxwriter
+from datetime import date, datetime
 from pathlib import Path
-from data.data_loader import load_data
-from data.preprocess import clean_data
+from data.data_loader import load_clean_data, with_country_names
+from data.cached_loaders import get_wb_poverty, get_india_poverty
+from data.preprocess import latest_year_slice
+from components.tables import csv_bytes
 from utils.pdf_generator import generate_pdf_report
 import config
 
@@ -41,7 +46,7 @@ def render_data_export(filters):
     
     st.subheader("💾 Data Export")
     
-    st.markdown("Download filtered data in CSV or Excel format")
+    st.markdown("Download filtered data in CSV, Excel, or Parquet format")
     
     # Data source selection
     col1, col2 = st.columns(2)
@@ -53,50 +58,30 @@ def render_data_export(filters):
         )
     
     with col2:
-        file_format = st.radio("File Format", ["CSV", "Excel"], horizontal=True)
+        file_format = st.radio("File Format", ["CSV", "Excel", "Parquet"], horizontal=True)
     
-    # Load data based on selection
+    # Load data based on selection (the cached loaders return cleaned frames)
     with st.spinner("Loading data..."):
         if data_source == "Global Poverty Data":
-            data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = with_country_names(get_wb_poverty(filters['year_range']))
             filename = "global_poverty_data"
         
         elif data_source == "India Poverty Data":
-            data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = get_india_poverty(filters['year_range'])
             filename = "india_poverty_data"
         
         elif data_source == "India Demographics":
-            data = load_data('india_demographics')
+            data = load_clean_data('india_demographics')
             filename = "india_demographics"
         
         else:  # All Data
-            wb_data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-            india_data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            wb_data = with_country_names(get_wb_poverty(filters['year_range']))
+            india_data = get_india_poverty(filters['year_range'])
             # For "All Data", we'll export both as separate sheets (Excel) or combined (CSV)
             data = {'global': wb_data, 'india': india_data}
             filename = "all_poverty_data"
     
     if isinstance(data, pd.DataFrame):
-        data = clean_data(data)
-        
         # Preview data
         st.markdown("#### Data Preview")
         st.dataframe(data.head(100), use_container_width=True)
@@ -107,27 +92,29 @@ def render_data_export(filters):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if file_format == "CSV":
-            csv = data.to_csv(index=False)
             st.download_button(
                 label="📥 Download CSV",
-                data=csv,
+                data=csv_bytes(data),
                 file_name=f"{filename}_{timestamp}.csv",
                 mime="text/csv"
             )
         
-        else:  # Excel
+        elif file_format == "Excel":
             # Create Excel file in memory
-            import io
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                data.to_excel(writer, sheet_name='Data', index=False)
-            
             st.download_button(
                 label="📥 Download Excel",
-                data=output.getvalue(),
+                data=_excel_bytes({'Data': data}),
                 file_name=f"{filename}_{timestamp}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
+        
+        else:  # Parquet
+            st.download_button(
+                label="📥 Download Parquet",
+                data=_parquet_bytes(data),
+                file_name=f"{filename}_{timestamp}.parquet",
+                mime="application/vnd.apache.parquet"
+            )
     
     elif isinstance(data, dict):
         # Multiple datasets
@@ -135,7 +122,7 @@ def render_data_export(filters):
         
         for key, df in data.items():
             with st.expander(f"Preview {key.capitalize()} Data"):
-                st.dataframe(clean_data(df).head(100), use_container_width=True)
+                st.dataframe(df.head(100), use_container_width=True)
         
         # Download
         st.markdown("#### Download")
@@ -143,29 +130,105 @@ def render_data_export(filters):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if file_format == "CSV":
-            # Combine all data for CSV
-            combined = pd.concat([df.assign(source=key) for key, df in data.items()], ignore_index=True)
-            csv = combined.to_csv(index=False)
+            # Combine all data for CSV (tagged with a 'source' column)
             st.download_button(
                 label="📥 Download Combined CSV",
-                data=csv,
+                data=csv_bytes(data),
                 file_name=f"{filename}_{timestamp}.csv",
                 mime="text/csv"
             )
         
-        else:  # Excel with multiple sheets
-            import io
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                for key, df in data.items():
-                    clean_data(df).to_excel(writer, sheet_name=key.capitalize(), index=False)
-            
+        elif file_format == "Excel":  # Excel with multiple sheets
             st.download_button(
                 label="📥 Download Excel (Multiple Sheets)",
-                data=output.getvalue(),
+                data=_excel_bytes({key.capitalize(): df for key, df in data.items()}),
                 file_name=f"{filename}_{timestamp}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
+        
+        else:  # Parquet, one file per dataset in a zip archive
+            archive = io.BytesIO()
+            with zipfile.ZipFile(archive, 'w') as zf:
+                for key, df in data.items():
+                    zf.writestr(f"{key}.parquet", _parquet_bytes(df))
+            
+            st.download_button(
+                label="📥 Download Parquet (Zip)",
+                data=archive.getvalue(),
+                file_name=f"{filename}_{timestamp}.zip",
+                mime="application/zip"
+            )
+
+
+def _widen_float32(df):
+    """
+    Upcast float32 columns to rounded float64 for spreadsheet export
+    
+    Excel stores doubles, so a float32 value such as 68.15 would otherwise
+    be written as 68.1500015258789. Loader values carry two decimals.
+    """
+    
+    float32_cols = df.select_dtypes(include='float32').columns
+    if float32_cols.empty:
+        return df
+    
+    return df.astype({col: 'float64' for col in float32_cols}).round({col: 2 for col in float32_cols})
+
+
+def _parquet_bytes(df):
+    """
+    Serialize a DataFrame to Parquet bytes
+    
+    Columnar and compressed, so exports are far smaller and faster to
+    produce than CSV/Excel; dtypes (float32, categoricals) are preserved.
+    
+    Args:
+        df (pd.DataFrame): Data to export
+    
+    Returns:
+        bytes: Parquet file contents
+    """
+    
+    output = io.BytesIO()
+    df.to_parquet(output, engine='pyarrow', compression='snappy', index=False)
+    return output.getvalue()
+
+
+def _excel_bytes(sheets):
+    """
+    Write DataFrames to an in-memory .xlsx workbook, one sheet each
+    
+    Uses xlsxwriter's constant_memory mode, which flushes each row as soon
+    as the next one starts, so memory stays flat regardless of row count.
+    That mode requires strictly row-by-row writes, and DataFrame.to_excel
+    writes column by column (it would lose all but the last row's cells),
+    so rows are written here directly.
+    
+    Args:
+        sheets (dict): Sheet name -> DataFrame
+    
+    Returns:
+        bytes: Workbook contents
+    """
+    
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    # Same header look as DataFrame.to_excel
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    
+    for sheet_name, df in sheets.items():
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+        
+        # Python scalars with None for missing values (written as empty cells)
+        values = _widen_float32(df).to_numpy(dtype=object)
+        values[pd.isna(values)] = None
+        
+        for row_idx, row in enumerate(values, start=1):
+            worksheet.write_row(row_idx, 0, row)
+    
+    workbook.close()
+    return output.getvalue()
 
 
 def render_pdf_reports(filters):
@@ -202,43 +265,24 @@ def render_pdf_reports(filters):
     # Generate button
     if st.button("🔄 Generate PDF Report", type="primary"):
         with st.spinner("Generating PDF report..."):
-            # Load necessary data
-            wb_data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-            
-            india_data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-            
-            # Generate report
+            # Generate report (cached: repeat clicks with the same settings
+            # on the same day reuse the PDF instead of rebuilding it; the
+            # date is part of the key because the PDF prints it)
             report_config = {
                 'report_type': report_type,
                 'include_charts': include_charts,
                 'include_tables': include_tables,
                 'include_statistics': include_statistics,
                 'include_insights': include_insights,
-                'filters': filters
+                'filters': filters,
+                'generated_on': date.today()
             }
             
-            pdf_path = generate_pdf_report(
-                wb_data=clean_data(wb_data),
-                india_data=clean_data(india_data),
-                config=report_config
-            )
+            pdf_bytes = _pdf_bytes(report_config)
             
-            if pdf_path and Path(pdf_path).exists():
+            if pdf_bytes:
                 st.success("✅ PDF report generated successfully!")
                 
-                # Read and offer download
-                with open(pdf_path, 'rb') as f:
-                    pdf_bytes = f.read()
-                
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 st.download_button(
                     label="📥 Download PDF Report",
@@ -250,6 +294,34 @@ def render_pdf_reports(filters):
                 st.error("Failed to generate PDF report")
 
 
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _pdf_bytes(report_config):
+    """
+    Generate a PDF report and return its contents
+    
+    Keyed on the report configuration; the data is loaded here from the
+    configured year range through the cached loaders, so the frames never
+    need hashing.
+    
+    Args:
+        report_config (dict): Report configuration, including 'filters'
+    
+    Returns:
+        bytes: PDF file contents, or None if generation failed
+    """
+    
+    year_range = report_config['filters']['year_range']
+    wb_data = with_country_names(get_wb_poverty(year_range))
+    india_data = get_india_poverty(year_range)
+    
+    pdf_path = generate_pdf_report(wb_data, india_data, report_config)
+    
+    if not pdf_path or not Path(pdf_path).exists():
+        return None
+    
+    return Path(pdf_path).read_bytes()
+
+
 def render_summary_reports(filters):
     """Render summary reports"""
     
@@ -259,55 +331,49 @@ def render_summary_reports(filters):
     
     # Load data
     with st.spinner("Loading data..."):
-        wb_data = load_data(
-            'wb_poverty',
-            indicator_code='SI.POV.DDAY',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1]
-        )
+        wb_data = with_country_names(get_wb_poverty(filters['year_range']))
         
-        india_data = load_data(
-            'india_poverty',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1]
-        )
+        india_data = get_india_poverty(filters['year_range'])
     
-    wb_data = clean_data(wb_data)
-    india_data = clean_data(india_data)
+    # Distinct counts, shared by the metrics and the summary text
+    n_countries = wb_data['country'].nunique() if not wb_data.empty else 'N/A'
+    n_states = india_data['state'].nunique() if not india_data.empty else 'N/A'
     
     # Global summary
     st.markdown("### 🌍 Global Summary")
     
     if not wb_data.empty:
-        latest_year = wb_data['year'].max()
-        latest_global = wb_data[wb_data['year'] == latest_year]
+        latest_year, latest_global = latest_year_slice(wb_data)
+        # One aggregation pass and one sort serve the metrics and both rankings
+        global_stats = latest_global['value'].agg(['mean', 'max', 'min'])
+        global_sorted = latest_global.sort_values('value', kind='stable')
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Countries", wb_data['country'].nunique())
+            st.metric("Countries", n_countries)
         
         with col2:
-            st.metric("Avg Poverty Rate", f"{latest_global['value'].mean():.2f}%")
+            st.metric("Avg Poverty Rate", f"{global_stats['mean']:.2f}%")
         
         with col3:
-            st.metric("Highest Rate", f"{latest_global['value'].max():.2f}%")
+            st.metric("Highest Rate", f"{global_stats['max']:.2f}%")
         
         with col4:
-            st.metric("Lowest Rate", f"{latest_global['value'].min():.2f}%")
+            st.metric("Lowest Rate", f"{global_stats['min']:.2f}%")
         
         # Top/Bottom countries
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### Top 5 Highest")
-            top5 = latest_global.nlargest(5, 'value')[['country_name', 'value']]
+            top5 = global_sorted.iloc[:-6:-1][['country_name', 'value']]
             top5.columns = ['Country', 'Rate (%)']
             st.dataframe(top5, use_container_width=True, hide_index=True)
         
         with col2:
             st.markdown("#### Top 5 Lowest")
-            bottom5 = latest_global.nsmallest(5, 'value')[['country_name', 'value']]
+            bottom5 = global_sorted.head(5)[['country_name', 'value']]
             bottom5.columns = ['Country', 'Rate (%)']
             st.dataframe(bottom5, use_container_width=True, hide_index=True)
     
@@ -317,23 +383,25 @@ def render_summary_reports(filters):
     st.markdown("### 🇮🇳 India Summary")
     
     if not india_data.empty:
-        latest_year = india_data['year'].max()
-        latest_india = india_data[india_data['year'] == latest_year]
+        latest_year, latest_india = latest_year_slice(india_data)
+        india_avg = latest_india['value'].mean()
+        area_avg = latest_india.groupby('area_type', observed=True)['value'].mean()
+        rural_avg = area_avg.get('Rural', float('nan'))
+        urban_avg = area_avg.get('Urban', float('nan'))
+        india_sorted = latest_india.sort_values('value', kind='stable')
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("States", india_data['state'].nunique())
+            st.metric("States", n_states)
         
         with col2:
-            st.metric("Avg Poverty Rate", f"{latest_india['value'].mean():.2f}%")
+            st.metric("Avg Poverty Rate", f"{india_avg:.2f}%")
         
         with col3:
-            rural_avg = latest_india[latest_india['area_type'] == 'Rural']['value'].mean()
             st.metric("Rural Average", f"{rural_avg:.2f}%")
         
         with col4:
-            urban_avg = latest_india[latest_india['area_type'] == 'Urban']['value'].mean()
             st.metric("Urban Average", f"{urban_avg:.2f}%")
         
         # Top/Bottom states
@@ -341,13 +409,13 @@ def render_summary_reports(filters):
         
         with col1:
             st.markdown("#### Top 5 Highest")
-            top5_india = latest_india.nlargest(5, 'value')[['state', 'area_type', 'value']]
+            top5_india = india_sorted.iloc[:-6:-1][['state', 'area_type', 'value']]
             top5_india.columns = ['State', 'Area', 'Rate (%)']
             st.dataframe(top5_india, use_container_width=True, hide_index=True)
         
         with col2:
             st.markdown("#### Top 5 Lowest")
-            bottom5_india = latest_india.nsmallest(5, 'value')[['state', 'area_type', 'value']]
+            bottom5_india = india_sorted.head(5)[['state', 'area_type', 'value']]
             bottom5_india.columns = ['State', 'Area', 'Rate (%)']
             st.dataframe(bottom5_india, use_container_width=True, hide_index=True)
     
@@ -360,12 +428,12 @@ POVERTY DASHBOARD SUMMARY REPORT
 Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 GLOBAL STATISTICS ({latest_year if not wb_data.empty else 'N/A'})
-- Countries tracked: {wb_data['country'].nunique() if not wb_data.empty else 'N/A'}
-- Average poverty rate: {latest_global['value'].mean():.2f}% if not wb_data.empty else 'N/A'
+- Countries tracked: {n_countries}
+- Average poverty rate: {global_stats['mean']:.2f}% if not wb_data.empty else 'N/A'
 
 INDIA STATISTICS ({latest_year if not india_data.empty else 'N/A'})
-- States tracked: {india_data['state'].nunique() if not india_data.empty else 'N/A'}
-- Average poverty rate: {latest_india['value'].mean():.2f}% if not india_data.empty else 'N/A'
+- States tracked: {n_states}
+- Average poverty rate: {india_avg:.2f}% if not india_data.empty else 'N/A'
 - Rural average: {rural_avg:.2f}%
 - Urban average: {urban_avg:.2f}%
         """
@@ -4,8 +4,10 @@ Rural vs Urban Page - Comparison of poverty rates by area type
 
 import streamlit as st
 import pandas as pd
-from data.data_loader import load_data
-from data.preprocess import clean_data, filter_data
+import numpy as np
+import plotly.graph_objects as go
+from data.cached_loaders import get_india_poverty
+from data.preprocess import latest_year_slice, sorted_labels
 from utils.visualization import create_line_chart, create_bar_chart, create_box_plot
 import config
 
@@ -17,25 +19,28 @@ def render(filters):
     st.markdown("Compare poverty rates between rural and urban areas across Indian states")
     st.markdown("---")
     
-    # Load India data
+    # Load India data (cleaned and cached per year range and state selection)
     with st.spinner("Loading India poverty data..."):
-        india_data = load_data(
-            'india_poverty',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1],
+        india_data = get_india_poverty(
+            filters['year_range'],
             states=filters.get('states'),
             area_type='All'  # Load both rural and urban
         )
     
-    india_data = clean_data(india_data)
-    
     if india_data.empty:
         st.warning("No data available for selected filters")
         return
     
+    # Latest-year slice and its rural/urban split, computed once for all sections
+    latest_year, latest_data = latest_year_slice(india_data)
+    latest_by_area = dict(tuple(latest_data.groupby('area_type', observed=True, sort=False)))
+    empty = latest_data.iloc[:0]
+    latest_rural = latest_by_area.get('Rural', empty)
+    latest_urban = latest_by_area.get('Urban', empty)
+    
     # Overview metrics
     st.subheader("📊 Overview")
-    render_overview_metrics(india_data)
+    render_overview_metrics(india_data, latest_rural, latest_urban)
     
     st.markdown("---")
     
@@ -54,20 +59,82 @@ def render(filters):
         render_state_comparison(india_data)
     
     with tab3:
-        render_distribution_analysis(india_data)
+        render_distribution_analysis(latest_year, latest_data, latest_rural, latest_urban)
     
     with tab4:
-        render_gap_analysis(india_data)
+        render_gap_analysis(india_data, latest_year)
 
 
-def render_overview_metrics(india_data):
-    """Render overview metrics comparing rural and urban"""
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _gap_frame(india_data):
+    """
+    Rural and urban rates side by side per state and year, with their gap
+    
+    Args:
+        india_data (pd.DataFrame): India poverty data with both area types
+    
+    Returns:
+        pd.DataFrame: Columns [state, year, value_rural, value_urban, gap]
+    """
+    
+    # One groupby + unstack instead of two filtered copies and a merge
+    wide = (
+        india_data.groupby(['state', 'year', 'area_type'], observed=True, sort=False)['value']
+        .mean()
+        .unstack('area_type')
+        .reindex(columns=['Rural', 'Urban'])
+        .dropna()
+    )
+    
+    # Columns are aligned by the unstack, so the gap is a plain array
+    # subtraction with no index alignment
+    values = wide.to_numpy()
+    rural, urban = values[:, 0], values[:, 1]
     
-    latest_year = india_data['year'].max()
-    latest_data = india_data[india_data['year'] == latest_year]
+    gap_data = pd.DataFrame({
+        'value_rural': rural,
+        'value_urban': urban,
+        'gap': rural - urban
+    }, index=wide.index).reset_index()
     
-    rural_data = latest_data[latest_data['area_type'] == 'Rural']
-    urban_data = latest_data[latest_data['area_type'] == 'Urban']
+    return gap_data
+
+
+def _describe_areas(area_frames):
+    """
+    describe()-style summary of 'value' for already-split area frames
+    
+    One np.percentile call per area instead of the groupby().describe()
+    machinery; empty areas are left out, as with observed groups.
+    
+    Args:
+        area_frames (dict): area_type -> DataFrame with a 'value' column
+    
+    Returns:
+        pd.DataFrame: One row per area with count, mean, std, min, quartiles, max
+    """
+    
+    rows = {}
+    for area, frame in area_frames.items():
+        values = frame['value'].to_numpy(dtype=np.float64)
+        if values.size == 0:
+            continue
+        q25, q50, q75 = np.percentile(values, [25, 50, 75])
+        std = values.std(ddof=1) if values.size > 1 else np.nan
+        rows[area] = [values.size, values.mean(), std, values.min(), q25, q50, q75, values.max()]
+    
+    summary = pd.DataFrame.from_dict(
+        rows,
+        orient='index',
+        columns=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    )
+    summary.index.name = 'area_type'
+    
+    return summary.round(2)
+
+
+def render_overview_metrics(india_data, rural_data, urban_data):
+    """Render overview metrics comparing rural and urban (latest-year slices)"""
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -94,7 +161,7 @@ def render_time_trends(india_data):
     st.subheader("📈 Poverty Rate Trends Over Time")
     
     # Aggregate by area type and year
-    trend_data = india_data.groupby(['area_type', 'year'])['value'].mean().reset_index()
+    trend_data = india_data.groupby(['area_type', 'year'], observed=True)['value'].mean().reset_index()
     
     fig = create_line_chart(
         trend_data,
@@ -110,7 +177,7 @@ def render_time_trends(india_data):
     # State-specific trends
     st.markdown("#### State-Specific Trends")
     
-    states = sorted(india_data['state'].unique())
+    states = sorted_labels(india_data['state'])
     selected_states = st.multiselect(
         "Select states to compare",
         options=states,
@@ -120,8 +187,11 @@ def render_time_trends(india_data):
     if selected_states:
         state_data = india_data[india_data['state'].isin(selected_states)]
         
-        # Create a combined column for better legend
-        state_data['state_area'] = state_data['state'] + ' - ' + state_data['area_type']
+        # Create a combined column for better legend (assign returns a new
+        # frame, so the filtered slice isn't written to or defensively copied)
+        state_data = state_data.assign(
+            state_area=state_data['state'].astype(str) + ' - ' + state_data['area_type'].astype(str)
+        )
         
         fig = create_line_chart(
             state_data,
@@ -147,12 +217,13 @@ def render_state_comparison(india_data):
     year_data = india_data[india_data['year'] == selected_year]
     
     # Pivot data for side-by-side comparison
-    pivot_data = year_data.pivot_table(
-        index='state',
-        columns='area_type',
-        values='value',
-        aggfunc='mean'
-    ).reset_index()
+    pivot_data = (
+        year_data.groupby(['state', 'area_type'], observed=True)['value']
+        .mean()
+        .unstack('area_type')
+        .reset_index()
+    )
+    pivot_data.columns = list(pivot_data.columns)  # plain labels, so a 'Gap' column can be added
     
     # Sort by rural poverty rate
     pivot_data = pivot_data.sort_values('Rural', ascending=False)
@@ -179,14 +250,11 @@ def render_state_comparison(india_data):
         st.dataframe(pivot_data, use_container_width=True, hide_index=True)
 
 
-def render_distribution_analysis(india_data):
-    """Render distribution analysis"""
+def render_distribution_analysis(latest_year, latest_data, rural_data, urban_data):
+    """Render distribution analysis for the latest year"""
     
     st.subheader("📊 Distribution Analysis")
     
-    latest_year = india_data['year'].max()
-    latest_data = india_data[india_data['year'] == latest_year]
-    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -204,58 +272,48 @@ def render_distribution_analysis(india_data):
     with col2:
         st.markdown("#### Statistical Summary")
         
-        summary_stats = latest_data.groupby('area_type')['value'].describe().round(2)
+        summary_stats = _describe_areas({'Rural': rural_data, 'Urban': urban_data})
         st.dataframe(summary_stats, use_container_width=True)
     
     # Histogram comparison
     st.markdown("#### Distribution Histogram")
     
-    import plotly.graph_objects as go
-    
-    rural_values = latest_data[latest_data['area_type'] == 'Rural']['value']
-    urban_values = latest_data[latest_data['area_type'] == 'Urban']['value']
-    
-    fig = go.Figure()
-    fig.add_trace(go.Histogram(
-        x=rural_values,
-        name='Rural',
-        opacity=0.7,
-        marker_color=config.COLOR_SCHEME['rural']
-    ))
-    fig.add_trace(go.Histogram(
-        x=urban_values,
-        name='Urban',
-        opacity=0.7,
-        marker_color=config.COLOR_SCHEME['urban']
-    ))
-    
-    fig.update_layout(
-        title='Poverty Rate Distribution Comparison',
-        xaxis_title='Poverty Rate (%)',
-        yaxis_title='Frequency',
-        barmode='overlay',
-        template='plotly_white'
+    # Traces and layout in one constructor; plain arrays skip plotly's
+    # Series conversion
+    fig = go.Figure(
+        data=[
+            go.Histogram(
+                x=rural_data['value'].to_numpy(),
+                name='Rural',
+                opacity=0.7,
+                marker_color=config.COLOR_SCHEME['rural']
+            ),
+            go.Histogram(
+                x=urban_data['value'].to_numpy(),
+                name='Urban',
+                opacity=0.7,
+                marker_color=config.COLOR_SCHEME['urban']
+            )
+        ],
+        layout=go.Layout(
+            title='Poverty Rate Distribution Comparison',
+            xaxis_title='Poverty Rate (%)',
+            yaxis_title='Frequency',
+            barmode='overlay',
+            template='plotly_white'
+        )
     )
     
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_gap_analysis(india_data):
-    """Render rural-urban gap analysis"""
+def render_gap_analysis(india_data, latest_year):
+    """Render rural-urban gap analysis (latest_year as computed in render)"""
     
     st.subheader("📉 Rural-Urban Poverty Gap Analysis")
     
     # Calculate gap for each state and year
-    rural_data = india_data[india_data['area_type'] == 'Rural'].copy()
-    urban_data = india_data[india_data['area_type'] == 'Urban'].copy()
-    
-    # Merge and calculate gap
-    gap_data = rural_data.merge(
-        urban_data,
-        on=['state', 'year'],
-        suffixes=('_rural', '_urban')
-    )
-    gap_data['gap'] = gap_data['value_rural'] - gap_data['value_urban']
+    gap_data = _gap_frame(india_data)
     
     # Gap trends over time
     st.markdown("#### Gap Trends Over Time")
@@ -276,7 +334,7 @@ def render_gap_analysis(india_data):
     # States with largest gaps
     st.markdown("#### States with Largest Gaps")
     
-    latest_year = gap_data['year'].max()
+    # One sort serves the table below as well as both top-10 charts
     latest_gaps = gap_data[gap_data['year'] == latest_year].sort_values('gap', ascending=False)
     
     col1, col2 = st.columns(2)
@@ -298,7 +356,7 @@ def render_gap_analysis(india_data):
     
     with col2:
         st.markdown("##### Top 10 Smallest Gaps")
-        bottom_gaps = latest_gaps.tail(10).sort_values('gap')
+        bottom_gaps = latest_gaps.iloc[:-11:-1]  # last 10 reversed, smallest first
         fig = create_bar_chart(
             bottom_gaps,
             x='state',
@@ -313,7 +371,7 @@ def render_gap_analysis(india_data):
     
     # Gap data table
     with st.expander("📋 View Complete Gap Analysis"):
-        gap_table = latest_gaps[['state', 'value_rural', 'value_urban', 'gap']].copy()
-        gap_table.columns = ['State', 'Rural Rate (%)', 'Urban Rate (%)', 'Gap (pp)']
-        gap_table = gap_table.round(2)
+        gap_table = latest_gaps[['state', 'value_rural', 'value_urban', 'gap']].set_axis(
+            ['State', 'Rural Rate (%)', 'Urban Rate (%)', 'Gap (pp)'], axis=1
+        ).round(2)
         st.dataframe(gap_table, use_container_width=True, hide_index=True)
@@ -4,8 +4,10 @@ Visualization Page - Interactive charts and maps
 
 import streamlit as st
 import pandas as pd
-from data.data_loader import load_data
-from data.preprocess import clean_data, filter_data
+import numpy as np
+from data.data_loader import load_data, with_country_names, wb_metadata_by_code
+from data.cached_loaders import get_wb_poverty, get_india_poverty, get_india_multi_indicator, get_yearly_mean
+from data.preprocess import latest_year_slice, sorted_labels
 from utils.visualization import (
     create_line_chart, create_bar_chart, create_pie_chart,
     create_scatter_plot, create_box_plot, create_choropleth_map
@@ -13,6 +15,11 @@ from utils.visualization import (
 import config
 
 
+# Pie chart bands: upper edges of the first three levels (the last runs to 100%)
+POVERTY_LEVEL_EDGES = (10, 20, 30)
+POVERTY_LEVELS = ('Low (<10%)', 'Medium (10-20%)', 'High (20-30%)', 'Very High (>30%)')
+
+
 def render(filters):
     """Render the visualization page"""
     
@@ -50,6 +57,86 @@ def render(filters):
         render_geographic_map(filters)
 
 
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _scatter_frame(year_range):
+    """
+    Latest-year India indicators per state, merged with state demographics
+    
+    Args:
+        year_range (tuple): (start_year, end_year)
+    
+    Returns:
+        pd.DataFrame: One row per state, one column per indicator/demographic
+    """
+    
+    india_data = get_india_multi_indicator(year_range)
+    if india_data.empty:
+        return india_data
+    
+    _, latest_data = latest_year_slice(india_data)
+    
+    # Pivot to get different indicators as columns
+    pivot_data = latest_data.pivot_table(
+        index='state',
+        columns='indicator',
+        values='value',
+        aggfunc='mean',
+        observed=True
+    ).reset_index()
+    
+    # Merge with demographics on matching categorical 'state' keys, so the
+    # join runs on integer codes (the cast is a no-op for the synthetic
+    # loaders, which already share the dtype)
+    demographics = load_data('india_demographics')
+    demographics = demographics.astype({'state': pivot_data['state'].dtype})
+    
+    return pivot_data.merge(demographics, on='state', how='left')
+
+
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def _state_means_by_year(year_range, area_type):
+    """
+    Average India poverty rate per state, split by year
+    
+    One groupby covers every year, so the map's year selector only looks
+    up a precomputed frame instead of masking and aggregating per rerun.
+    
+    Args:
+        year_range (tuple): (start_year, end_year)
+        area_type (str): 'All', 'Rural', or 'Urban'
+    
+    Returns:
+        dict: year -> pd.DataFrame with columns [state, value]
+    """
+    
+    india_data = get_india_poverty(year_range, area_type=area_type)
+    if india_data.empty:
+        return {}
+    
+    # Rural/Urban rows averaged per state: bincount over a combined
+    # (year, state code) key gives every year's sums and counts in one pass
+    state = india_data['state']
+    state_codes = state.cat.codes.to_numpy()
+    n_states = len(state.cat.categories)
+    years, year_idx = np.unique(india_data['year'].to_numpy(), return_inverse=True)
+    
+    keys = year_idx * n_states + state_codes
+    size = len(years) * n_states
+    sums = np.bincount(keys, weights=india_data['value'].to_numpy(dtype=np.float64), minlength=size)
+    counts = np.bincount(keys, minlength=size)
+    sums, counts = sums.reshape(len(years), n_states), counts.reshape(len(years), n_states)
+    
+    state_means = {}
+    for i, year in enumerate(years):
+        present = np.flatnonzero(counts[i])
+        state_means[int(year)] = pd.DataFrame({
+            'state': pd.Categorical.from_codes(present, dtype=state.dtype),
+            'value': sums[i, present] / counts[i, present]
+        })
+    
+    return state_means
+
+
 def render_line_chart(filters):
     """Render line chart visualization"""
     
@@ -66,33 +153,23 @@ def render_line_chart(filters):
     # Load data
     with st.spinner("Loading data..."):
         if data_source == "Global":
-            data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = with_country_names(get_wb_poverty(filters['year_range']))
             category_col = 'country_name' if 'country_name' in data.columns else 'country'
         else:
-            data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = get_india_poverty(filters['year_range'])
             category_col = 'state'
     
-    data = clean_data(data)
-    
     if data.empty:
         st.warning("No data available")
         return
     
     # Category selection if grouping
     if group_by == "Category":
+        options = sorted_labels(data[category_col])
         categories = st.multiselect(
             f"Select {category_col}s",
-            options=sorted(data[category_col].unique()),
-            default=sorted(data[category_col].unique())[:5]
+            options=options,
+            default=options[:5]
         )
         
         if categories:
@@ -111,8 +188,11 @@ def render_line_chart(filters):
             st.info("Please select at least one category")
             return
     else:
-        # Aggregate data
-        agg_data = data.groupby('year')['value'].mean().reset_index()
+        # Yearly average, shared with the dashboard/ML caches for the same data
+        agg_data = get_yearly_mean(
+            'wb_poverty' if data_source == "Global" else 'india_poverty',
+            filters['year_range']
+        )
         
         fig = create_line_chart(
             agg_data,
@@ -145,30 +225,19 @@ def render_bar_chart(filters):
     # Load data
     with st.spinner("Loading data..."):
         if data_source == "Global":
-            data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = with_country_names(get_wb_poverty(filters['year_range']))
             category_col = 'country_name' if 'country_name' in data.columns else 'country'
         else:
-            data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = get_india_poverty(filters['year_range'])
             category_col = 'state'
     
-    data = clean_data(data)
-    
     if data.empty:
         st.warning("No data available")
         return
     
-    # Get latest year data
-    latest_year = data['year'].max()
-    latest_data = data[data['year'] == latest_year].sort_values('value', ascending=False).head(top_n)
+    # Get latest year data; nlargest selects the top N without a full sort
+    latest_year, latest_data = latest_year_slice(data)
+    latest_data = latest_data.nlargest(top_n, 'value')
     
     fig = create_bar_chart(
         latest_data,
@@ -190,34 +259,15 @@ def render_scatter_plot_viz(filters):
     
     st.markdown("Analyze relationships between different indicators")
     
-    # Load multi-indicator data
+    # Load the latest-year indicator/demographics table (cached, so changing
+    # the axis variables reruns without any pandas work)
     with st.spinner("Loading data..."):
-        india_data = load_data('india_multi_indicator',
-                              start_year=filters['year_range'][0],
-                              end_year=filters['year_range'][1])
-        demographics = load_data('india_demographics')
-    
-    india_data = clean_data(india_data)
+        pivot_data = _scatter_frame(tuple(filters['year_range']))
     
-    if india_data.empty:
+    if pivot_data.empty:
         st.warning("No data available")
         return
     
-    # Prepare data
-    latest_year = india_data['year'].max()
-    latest_data = india_data[india_data['year'] == latest_year]
-    
-    # Pivot to get different indicators as columns
-    pivot_data = latest_data.pivot_table(
-        index='state',
-        columns='indicator',
-        values='value',
-        aggfunc='mean'
-    ).reset_index()
-    
-    # Merge with demographics
-    pivot_data = pivot_data.merge(demographics, on='state', how='left')
-    
     # Variable selection
     col1, col2 = st.columns(2)
     
@@ -253,31 +303,20 @@ def render_box_plot_viz(filters):
     # Load data
     with st.spinner("Loading data..."):
         if data_source == "Global":
-            data = load_data(
-                'wb_poverty',
-                indicator_code='SI.POV.DDAY',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
-            data = data.merge(load_data('wb_metadata'), left_on='country', right_on='country_code', how='left')
+            data = get_wb_poverty(filters['year_range']).join(wb_metadata_by_code(), on='country', how='left')
+            # Countries without metadata are grouped as 'Unknown'
+            data['region'] = data['region'].cat.add_categories('Unknown').fillna('Unknown')
             group_col = 'region'
         else:
-            data = load_data(
-                'india_poverty',
-                start_year=filters['year_range'][0],
-                end_year=filters['year_range'][1]
-            )
+            data = get_india_poverty(filters['year_range'])
             group_col = 'area_type'
     
-    data = clean_data(data)
-    
     if data.empty or group_col not in data.columns:
         st.warning("No data available")
         return
     
     # Get latest year
-    latest_year = data['year'].max()
-    latest_data = data[data['year'] == latest_year]
+    latest_year, latest_data = latest_year_slice(data)
     
     fig = create_box_plot(
         latest_data,
@@ -300,31 +339,22 @@ def render_pie_chart(filters):
     
     # Load India data for pie chart
     with st.spinner("Loading data..."):
-        india_data = load_data(
-            'india_poverty',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1]
-        )
-    
-    india_data = clean_data(india_data)
+        india_data = get_india_poverty(filters['year_range'])
     
     if india_data.empty:
         st.warning("No data available")
         return
     
     # Get latest year
-    latest_year = india_data['year'].max()
-    latest_data = india_data[india_data['year'] == latest_year]
-    
-    # Categorize poverty levels
-    latest_data['poverty_level'] = pd.cut(
-        latest_data['value'],
-        bins=[0, 10, 20, 30, 100],
-        labels=['Low (<10%)', 'Medium (10-20%)', 'High (20-30%)', 'Very High (>30%)']
-    )
+    latest_year, latest_data = latest_year_slice(india_data)
+    
+    # Count values per poverty level: bins (0, 10], (10, 20], (20, 30], (30, 100]
+    # as pd.cut would assign them, counted directly with bincount
+    values = latest_data['value'].to_numpy()
+    values = values[(values > 0) & (values <= 100)]
+    counts = np.bincount(np.searchsorted(POVERTY_LEVEL_EDGES, values), minlength=len(POVERTY_LEVELS))
     
-    # Count by category
-    pie_data = latest_data.groupby('poverty_level').size().reset_index(name='count')
+    pie_data = pd.DataFrame({'poverty_level': POVERTY_LEVELS, 'count': counts})
     
     fig = create_pie_chart(
         pie_data,
@@ -343,31 +373,19 @@ def render_geographic_map(filters):
     
     st.markdown("Interactive map showing poverty rates across Indian states")
     
-    # Load India data
+    # Load per-year state averages (cached; picking a year is a dict lookup)
     with st.spinner("Loading data..."):
-        india_data = load_data(
-            'india_poverty',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1],
-            area_type=filters.get('area_type', 'All')
-        )
+        state_means = _state_means_by_year(tuple(filters['year_range']), filters.get('area_type', 'All'))
     
-    india_data = clean_data(india_data)
-    
-    if india_data.empty:
+    if not state_means:
         st.warning("No data available")
         return
     
     # Year selection
-    year_options = sorted(india_data['year'].unique(), reverse=True)
+    year_options = sorted(state_means, reverse=True)
     selected_year = st.selectbox("Select Year", options=year_options, index=0, key='map_year')
     
-    # Filter data
-    map_data = india_data[india_data['year'] == selected_year]
-    
-    # Aggregate by state if needed
-    if 'area_type' in map_data.columns:
-        map_data = map_data.groupby('state')['value'].mean().reset_index()
+    map_data = state_means[selected_year]
     
     # Create choropleth map
     fig = create_choropleth_map(
@@ -3,7 +3,7 @@ Utils module for Poverty Dashboard
 Utility functions for visualization, statistics, ML, and reporting
 """
 
-from . import visualization, stats, ml, pdf_generator
+import importlib
 
 __all__ = [
     'visualization',
@@ -11,3 +11,11 @@ __all__ = [
     'ml',
     'pdf_generator',
 ]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access so that importing one of them
+    # (e.g. utils.visualization) doesn't also pull in sklearn and reportlab
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
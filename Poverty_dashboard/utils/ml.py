@@ -3,16 +3,70 @@ Machine Learning Utilities
 Functions for ML models and predictions
 """
 
+import os
+
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
 from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
-from sklearn.preprocessing import StandardScaler
 import config
 
 
+def _prepare_xy(data, target, features, model_type):
+    """
+    Extract feature matrix and target vector, dropping rows with NaN
+    
+    Rows are dropped on the frame first, so X and y are each converted once.
+    Tree ensembles get float32 features, which is what sklearn's tree code
+    works in anyway; linear regression keeps float64 for the solver.
+    
+    Args:
+        data (pd.DataFrame): Input data
+        target (str): Target column name
+        features (list): Feature column names
+        model_type (str): Model type from config.ML_MODELS
+    
+    Returns:
+        tuple: (X, y) as numpy arrays
+    """
+    
+    clean = data.dropna(subset=list(features) + [target])
+    x_dtype = np.float32 if model_type in ('Random Forest', 'Gradient Boosting') else np.float64
+    
+    X = clean[features].to_numpy(dtype=x_dtype)
+    y = clean[target].to_numpy(dtype=np.float64)
+    
+    return X, y
+
+
+def _gradient_boosting(n_rows):
+    """
+    Build the 'Gradient Boosting' estimator for a training set size
+    
+    Small sets (such as the yearly-average series) keep the exact-split
+    GradientBoostingRegressor, which fits them quickly and exposes
+    feature_importances_. From config.ML_HIST_GB_MIN_ROWS rows on,
+    histogram-based boosting is used instead: it bins features into at
+    most 256 buckets and fits far faster, but has no impurity-based
+    feature importances.
+    
+    Args:
+        n_rows (int): Number of training rows
+    
+    Returns:
+        Unfitted GradientBoostingRegressor or HistGradientBoostingRegressor
+            (100 boosting iterations either way)
+    """
+    
+    if n_rows < config.ML_HIST_GB_MIN_ROWS:
+        return GradientBoostingRegressor(random_state=config.ML_RANDOM_STATE)
+    
+    return HistGradientBoostingRegressor(random_state=config.ML_RANDOM_STATE)
+
+
 def train_model(data, target, features, model_type='Linear Regression'):
     """
     Train a machine learning model
@@ -27,14 +81,8 @@ def train_model(data, target, features, model_type='Linear Regression'):
         tuple: (trained_model, metrics_dict, predictions_df)
     """
     
-    # Prepare data
-    X = data[features].values
-    y = data[target].values
-    
-    # Remove NaN values
-    mask = ~(np.isnan(X).any(axis=1) | np.isnan(y))
-    X = X[mask]
-    y = y[mask]
+    # Prepare data (NaN rows removed)
+    X, y = _prepare_xy(data, target, features, model_type)
     
     if len(X) == 0:
         return None, {}, pd.DataFrame()
@@ -56,10 +104,7 @@ def train_model(data, target, features, model_type='Linear Regression'):
             n_jobs=-1
         )
     elif model_type == 'Gradient Boosting':
-        model = GradientBoostingRegressor(
-            n_estimators=100,
-            random_state=config.ML_RANDOM_STATE
-        )
+        model = _gradient_boosting(len(X_train))
     else:
         model = LinearRegression()
     
@@ -96,8 +141,19 @@ def evaluate_model(y_true, y_pred):
     rmse = np.sqrt(mean_squared_error(y_true, y_pred))
     mae = mean_absolute_error(y_true, y_pred)
     
-    # MAPE (Mean Absolute Percentage Error)
-    mape = np.mean(np.abs((y_true - y_pred) / y_true)) * 100
+    # MAPE (Mean Absolute Percentage Error) over the non-zero targets only;
+    # a zero target has no defined percentage error (NaN if all are zero)
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+    nonzero = y_true != 0
+    if nonzero.any():
+        actual = y_true[nonzero]
+        errors = y_pred[nonzero]
+        errors -= actual
+        errors /= actual
+        mape = np.abs(errors, out=errors).mean() * 100
+    else:
+        mape = np.nan
     
     return {
         'r2': r2,
@@ -107,14 +163,19 @@ def evaluate_model(y_true, y_pred):
     }
 
 
-def predict_future(model, historical_data, years_ahead=5):
+def predict_future(model, historical_data, years_ahead=5, features=None):
     """
     Predict future values
     
+    Non-year features are held at their historical mean, and all future
+    years are predicted in a single batch.
+    
     Args:
         model: Trained model
         historical_data (pd.DataFrame): Historical data with 'year' and 'value'
         years_ahead (int): Number of years to predict
+        features (list): Feature columns the model was trained on, which
+            must include 'year' (defaults to ['year'])
     
     Returns:
         pd.DataFrame: Future predictions
@@ -123,14 +184,18 @@ def predict_future(model, historical_data, years_ahead=5):
     if model is None or historical_data.empty:
         return pd.DataFrame()
     
+    features = list(features or ['year'])
+    
     # Get last year in historical data
     last_year = historical_data['year'].max()
     
     # Create future years
     future_years = np.arange(last_year + 1, last_year + years_ahead + 1)
     
-    # Prepare features (simplified - just year)
-    X_future = future_years.reshape(-1, 1)
+    # One contiguous feature block: historical means, then the year column
+    template = historical_data[features].mean().to_numpy(dtype=np.float64)
+    X_future = np.tile(template, (years_ahead, 1))
+    X_future[:, features.index('year')] = future_years
     
     # Predict
     predictions = model.predict(X_future)
@@ -186,14 +251,8 @@ def cross_validate_model(data, target, features, model_type='Linear Regression',
     
     from sklearn.model_selection import cross_val_score
     
-    # Prepare data
-    X = data[features].values
-    y = data[target].values
-    
-    # Remove NaN
-    mask = ~(np.isnan(X).any(axis=1) | np.isnan(y))
-    X = X[mask]
-    y = y[mask]
+    # Prepare data (NaN rows removed)
+    X, y = _prepare_xy(data, target, features, model_type)
     
     if len(X) < cv:
         return {'mean_score': 0, 'std_score': 0, 'scores': []}
@@ -204,7 +263,7 @@ def cross_validate_model(data, target, features, model_type='Linear Regression',
     elif model_type == 'Random Forest':
         model = RandomForestRegressor(random_state=config.ML_RANDOM_STATE)
     elif model_type == 'Gradient Boosting':
-        model = GradientBoostingRegressor(random_state=config.ML_RANDOM_STATE)
+        model = _gradient_boosting(len(X))
     else:
         model = LinearRegression()
     
@@ -232,16 +291,10 @@ def hyperparameter_tuning(data, target, features, model_type='Random Forest'):
         dict: Best parameters and score
     """
     
-    from sklearn.model_selection import GridSearchCV
+    from sklearn.model_selection import RandomizedSearchCV
     
-    # Prepare data
-    X = data[features].values
-    y = data[target].values
-    
-    # Remove NaN
-    mask = ~(np.isnan(X).any(axis=1) | np.isnan(y))
-    X = X[mask]
-    y = y[mask]
+    # Prepare data (NaN rows removed)
+    X, y = _prepare_xy(data, target, features, model_type)
     
     if len(X) < 10:
         return {'best_params': {}, 'best_score': 0}
@@ -255,29 +308,39 @@ def hyperparameter_tuning(data, target, features, model_type='Random Forest'):
             'min_samples_split': [2, 5, 10]
         }
     elif model_type == 'Gradient Boosting':
-        model = GradientBoostingRegressor(random_state=config.ML_RANDOM_STATE)
-        param_grid = {
-            'n_estimators': [50, 100, 200],
-            'learning_rate': [0.01, 0.1, 0.2],
-            'max_depth': [3, 5, 7]
-        }
+        model = _gradient_boosting(len(X))
+        if isinstance(model, GradientBoostingRegressor):
+            param_grid = {
+                'n_estimators': [50, 100, 200],
+                'learning_rate': [0.01, 0.1, 0.2],
+                'max_depth': [3, 5, 7]
+            }
+        else:
+            param_grid = {
+                'max_iter': [100, 200],
+                'learning_rate': [0.05, 0.1],
+                'max_leaf_nodes': [15, 31, 63]
+            }
     else:
         return {'best_params': {}, 'best_score': 0}
     
-    # Grid search
-    grid_search = GridSearchCV(
+    # Randomized search: samples a fixed number of grid combinations
+    # instead of fitting every one (27 for Random Forest)
+    search = RandomizedSearchCV(
         model, 
         param_grid, 
+        n_iter=config.ML_SEARCH_ITERATIONS,
         cv=3, 
         scoring='r2',
-        n_jobs=-1
+        n_jobs=-1,
+        random_state=config.ML_RANDOM_STATE
     )
     
-    grid_search.fit(X, y)
+    search.fit(X, y)
     
     return {
-        'best_params': grid_search.best_params_,
-        'best_score': grid_search.best_score_
+        'best_params': search.best_params_,
+        'best_score': search.best_score_
     }
 
 
@@ -293,13 +356,24 @@ def create_ensemble_prediction(models, X):
         np.array: Averaged predictions
     """
     
-    predictions = []
+    if not models:
+        raise ValueError("create_ensemble_prediction needs at least one model")
     
-    for model in models:
-        pred = model.predict(X)
-        predictions.append(pred)
+    # Large inputs predict concurrently, one thread per model up to the core
+    # count (sklearn's compiled predict code releases the GIL). Below the
+    # threshold a pool costs more to start than the predictions themselves.
+    n_jobs = min(len(models), os.cpu_count() or 1)
+    if n_jobs > 1 and len(X) >= config.ML_PARALLEL_PREDICT_MIN_ROWS:
+        predictions = Parallel(n_jobs=n_jobs, backend='threading')(
+            delayed(model.predict)(X) for model in models
+        )
+    else:
+        predictions = (model.predict(X) for model in models)
     
-    # Average predictions
-    ensemble_pred = np.mean(predictions, axis=0)
+    # Accumulate into one buffer instead of stacking every model's predictions
+    ensemble_pred = np.zeros(len(X), dtype=np.float64)
+    for pred in predictions:
+        ensemble_pred += pred
+    ensemble_pred /= len(models)
     
     return ensemble_pred
@@ -6,8 +6,6 @@ Functions for statistical calculations and analysis
 import pandas as pd
 import numpy as np
 from scipy import stats as scipy_stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
 import config
 
 
@@ -22,32 +20,44 @@ def get_summary_statistics(data):
         dict: Summary statistics
     """
     
-    if isinstance(data, pd.DataFrame):
-        data = data.values.flatten()
-    elif isinstance(data, pd.Series):
-        data = data.values
-    
-    # Remove NaN values
-    data = data[~np.isnan(data)]
+    # Remove NaN values; float32 input (the cleaned 'value' column) is kept
+    # as float32 and only the reductions accumulate in float64.
+    # Series drop NaN in pandas (which also handles pd.NA) before the single
+    # conversion; everything else is converted once and masked once
+    if isinstance(data, pd.Series):
+        data = _as_float_array(data.dropna(), keep_float32=True)
+    else:
+        data = _as_float_array(data, dropna=True, keep_float32=True)
     
     if len(data) == 0:
         return {}
     
+    # One partition for all quantiles, one pass for the central moments
+    q25, q50, q75 = np.percentile(data, [25, 50, 75])
+    data_min, data_max = data.min(), data.max()
+    mean = data.mean(dtype=np.float64)
+    dev = data - mean
+    dev2 = dev * dev
+    m2 = dev2.mean(dtype=np.float64)
+    m3 = (dev2 * dev).mean(dtype=np.float64)
+    m4 = (dev2 * dev2).mean(dtype=np.float64)
+    
     return {
         'count': len(data),
-        'mean': np.mean(data),
-        'median': np.median(data),
-        'std': np.std(data),
-        'variance': np.var(data),
-        'min': np.min(data),
-        'max': np.max(data),
-        'range': np.max(data) - np.min(data),
-        'q25': np.percentile(data, 25),
-        'q50': np.percentile(data, 50),
-        'q75': np.percentile(data, 75),
-        'iqr': np.percentile(data, 75) - np.percentile(data, 25),
-        'skewness': scipy_stats.skew(data),
-        'kurtosis': scipy_stats.kurtosis(data),
+        'mean': mean,
+        'median': q50,
+        'std': np.sqrt(m2),
+        'variance': m2,
+        'min': data_min,
+        'max': data_max,
+        'range': data_max - data_min,
+        'q25': q25,
+        'q50': q50,
+        'q75': q75,
+        'iqr': q75 - q25,
+        # Population (biased) skewness and excess kurtosis, as scipy.stats defaults
+        'skewness': m3 / m2 ** 1.5 if m2 > 0 else np.nan,
+        'kurtosis': m4 / m2 ** 2 - 3 if m2 > 0 else np.nan,
     }
 
 
@@ -73,7 +83,17 @@ def calculate_correlation(data, method='pearson'):
         return pd.DataFrame()
     
     try:
-        corr_matrix = numeric_data.corr(method=method)
+        values = numeric_data.to_numpy(dtype=np.float64)
+        
+        # Complete Pearson input goes straight to np.corrcoef (one BLAS
+        # product); pandas' NaN-aware pairwise path handles the rest
+        if method == 'pearson' and not np.isnan(values).any():
+            # Constant columns give NaN, as with DataFrame.corr
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_values = np.corrcoef(values, rowvar=False)
+            return pd.DataFrame(corr_values, index=numeric_data.columns, columns=numeric_data.columns)
+        
+        corr_matrix = numeric_data.corr(method=method, min_periods=1)
         return corr_matrix
     except Exception:
         return pd.DataFrame()
@@ -115,33 +135,88 @@ def perform_regression(X, y):
             'mae': 0
         }
     
-    # Fit model
-    model = LinearRegression()
-    model.fit(X, y)
+    # Ordinary least squares with an intercept column, solved directly;
+    # sklearn's LinearRegression adds validation and copies around the same solve
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    design = np.column_stack([np.ones(len(X)), X])
+    beta, *_ = np.linalg.lstsq(design, y, rcond=None)
+    intercept, coefficients = beta[0], beta[1:]
     
     # Predictions
-    y_pred = model.predict(X)
+    residuals = y - design @ beta
     
-    # Metrics
-    r2 = r2_score(y, y_pred)
+    # Metrics (r2 follows sklearn's r2_score for a constant target)
+    ss_res = residuals @ residuals
+    ss_tot = np.sum((y - y.mean()) ** 2)
+    if ss_tot > 0:
+        r2 = 1 - ss_res / ss_tot
+    else:
+        r2 = 1.0 if np.allclose(residuals, 0) else 0.0
     n = len(y)
     p = X.shape[1]
     adjusted_r2 = 1 - (1 - r2) * (n - 1) / (n - p - 1)
-    rmse = np.sqrt(mean_squared_error(y, y_pred))
-    mae = mean_absolute_error(y, y_pred)
+    rmse = np.sqrt(ss_res / n)
+    mae = np.mean(np.abs(residuals))
     
     return {
-        'coefficients': model.coef_.tolist(),
-        'intercept': float(model.intercept_),
+        'coefficients': coefficients.tolist(),
+        'intercept': float(intercept),
         'r2_score': r2,
         'adjusted_r2': adjusted_r2,
         'rmse': rmse,
-        'mae': mae,
-        'model': model
+        'mae': mae
     }
 
 
-def perform_ttest(group1, group2, alternative='two-sided'):
+def _as_float_array(data, dropna=False, keep_float32=False):
+    """
+    Convert input to a flat floating-point array in one step
+    
+    Args:
+        data (array-like): Input data
+        dropna (bool): Drop NaN values (skip for input known to be NaN-free,
+            e.g. the 'value' column after clean_data)
+        keep_float32 (bool): Keep float32 storage as is instead of upcasting
+    
+    Returns:
+        np.ndarray: 1-D float32 array for float32 input with keep_float32,
+            float64 otherwise
+    """
+    
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        data = data.to_numpy()
+    
+    data = np.asarray(data)
+    dtype = np.float32 if keep_float32 and data.dtype == np.float32 else np.float64
+    data = data.astype(dtype, copy=False).ravel()
+    
+    if dropna:
+        data = data[~np.isnan(data)]
+    
+    return data
+
+
+def _group_moments(data):
+    """
+    Reduce a clean 1-D array to its sufficient statistics
+    
+    Args:
+        data (np.ndarray): NaN-free 1-D array
+    
+    Returns:
+        tuple: (n, mean, sample variance with ddof=1)
+    """
+    
+    n = len(data)
+    mean = data.mean(dtype=np.float64)
+    dev = data - mean
+    var = np.dot(dev, dev) / (n - 1) if n > 1 else np.nan
+    
+    return n, mean, var
+
+
+def perform_ttest(group1, group2, alternative='two-sided', assume_clean=False):
     """
     Perform independent t-test
     
@@ -149,41 +224,53 @@ def perform_ttest(group1, group2, alternative='two-sided'):
         group1 (array-like): First group
         group2 (array-like): Second group
         alternative (str): 'two-sided', 'less', or 'greater'
+        assume_clean (bool): Inputs are known to be NaN-free
     
     Returns:
         dict: T-test results
     """
     
     # Remove NaN values
-    group1 = np.array(group1)[~np.isnan(group1)]
-    group2 = np.array(group2)[~np.isnan(group2)]
+    group1 = _as_float_array(group1, dropna=not assume_clean)
+    group2 = _as_float_array(group2, dropna=not assume_clean)
     
     if len(group1) == 0 or len(group2) == 0:
         return {'statistic': 0, 'pvalue': 1, 'significant': False}
     
     try:
-        statistic, pvalue = scipy_stats.ttest_ind(group1, group2, alternative=alternative)
+        # One reduction per group feeds both the test and the reported moments
+        n1, mean1, var1 = _group_moments(group1)
+        n2, mean2, var2 = _group_moments(group2)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            statistic, pvalue = scipy_stats.ttest_ind_from_stats(
+                mean1, np.sqrt(var1), n1,
+                mean2, np.sqrt(var2), n2,
+                alternative=alternative
+            )
         
         return {
             'statistic': float(statistic),
             'pvalue': float(pvalue),
             'significant': pvalue < (1 - config.CONFIDENCE_LEVEL),
-            'mean_group1': np.mean(group1),
-            'mean_group2': np.mean(group2),
-            'std_group1': np.std(group1),
-            'std_group2': np.std(group2)
+            'mean_group1': mean1,
+            'mean_group2': mean2,
+            # Population (ddof=0) standard deviations, as np.std
+            'std_group1': np.sqrt(var1 * (n1 - 1) / n1) if n1 > 1 else 0.0,
+            'std_group2': np.sqrt(var2 * (n2 - 1) / n2) if n2 > 1 else 0.0
         }
     except Exception:
         return {'statistic': 0, 'pvalue': 1, 'significant': False}
 
 
-def calculate_confidence_interval(data, confidence=None):
+def calculate_confidence_interval(data, confidence=None, assume_clean=False):
     """
     Calculate confidence interval
     
     Args:
         data (array-like): Input data
         confidence (float): Confidence level (default from config)
+        assume_clean (bool): Input is known to be NaN-free
     
     Returns:
         tuple: (lower_bound, upper_bound)
@@ -191,7 +278,7 @@ def calculate_confidence_interval(data, confidence=None):
     
     confidence = confidence or config.CONFIDENCE_LEVEL
     
-    data = np.array(data)[~np.isnan(data)]
+    data = _as_float_array(data, dropna=not assume_clean)
     
     if len(data) == 0:
         return (0, 0)
@@ -203,26 +290,38 @@ def calculate_confidence_interval(data, confidence=None):
     return (mean - margin, mean + margin)
 
 
-def perform_anova(*groups):
+def perform_anova(*groups, assume_clean=False):
     """
     Perform one-way ANOVA
     
     Args:
         *groups: Variable number of groups
+        assume_clean (bool): Groups are known to be NaN-free
     
     Returns:
         dict: ANOVA results
     """
     
     # Remove NaN values from each group
-    clean_groups = [np.array(g)[~np.isnan(g)] for g in groups]
+    clean_groups = [_as_float_array(g, dropna=not assume_clean) for g in groups]
     clean_groups = [g for g in clean_groups if len(g) > 0]
     
     if len(clean_groups) < 2:
         return {'f_statistic': 0, 'pvalue': 1, 'significant': False}
     
     try:
-        f_stat, pvalue = scipy_stats.f_oneway(*clean_groups)
+        # F statistic from per-group (n, mean, var):
+        # SSB = sum n_i (mean_i - grand)^2, SSW = sum (n_i - 1) var_i
+        n, means, variances = np.array([_group_moments(g) for g in clean_groups]).T
+        ss_within = np.dot(n - 1, np.nan_to_num(variances))
+        grand_mean = np.dot(n, means) / n.sum()
+        ss_between = np.dot(n, (means - grand_mean) ** 2)
+        df_between = len(clean_groups) - 1
+        df_within = n.sum() - len(clean_groups)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_stat = (ss_between / df_between) / (ss_within / df_within)
+        pvalue = scipy_stats.f.sf(f_stat, df_between, df_within)
         
         return {
             'f_statistic': float(f_stat),
@@ -245,7 +344,9 @@ def calculate_zscore(data):
         np.array: Z-scores
     """
     
-    data = np.array(data)
+    # NaN entries keep their position (and a NaN z-score); the nan-aware
+    # reductions ignore them
+    data = np.asarray(data, dtype=np.float64)
     mean = np.nanmean(data)
     std = np.nanstd(data)
     
@@ -268,19 +369,20 @@ def detect_outliers(data, method='iqr', threshold=3):
         np.array: Boolean mask of outliers
     """
     
-    data = np.array(data)
+    data = _as_float_array(data, keep_float32=True)
     
     if method == 'iqr':
-        q1 = np.nanpercentile(data, 25)
-        q3 = np.nanpercentile(data, 75)
+        q1, q3 = np.nanpercentile(data, [25, 75])
         iqr = q3 - q1
         lower_bound = q1 - threshold * iqr
         upper_bound = q3 + threshold * iqr
         outliers = (data < lower_bound) | (data > upper_bound)
     
     elif method == 'zscore':
-        zscores = np.abs(calculate_zscore(data))
-        outliers = zscores > threshold
+        # |x - mean| > threshold * std is |z| > threshold without
+        # materializing the z-score array (a constant series has no outliers)
+        deviation = np.abs(data - np.nanmean(data, dtype=np.float64))
+        outliers = deviation > threshold * np.nanstd(data, dtype=np.float64)
     
     else:
         outliers = np.zeros(len(data), dtype=bool)
@@ -300,19 +402,22 @@ def calculate_growth_rate(values, periods=1):
         np.array: Growth rates (as percentages)
     """
     
-    values = np.array(values)
+    if periods < 0:
+        raise ValueError(f"periods must be non-negative, got {periods}")
+    
+    values = np.asarray(values, dtype=np.float64)
     
     if len(values) < periods + 1:
         return np.array([])
     
-    growth_rates = np.zeros(len(values))
-    growth_rates[:periods] = np.nan
-    
-    for i in range(periods, len(values)):
-        if values[i - periods] != 0:
-            growth_rates[i] = ((values[i] - values[i - periods]) / values[i - periods]) * 100
-        else:
-            growth_rates[i] = np.nan
+    # Shifted slices replace the per-element loop; positions without a
+    # previous value (the first periods, or a zero base) stay NaN.
+    # The end is len - periods rather than -periods so periods=0 works
+    prev = values[:len(values) - periods]
+    curr = values[periods:]
+    growth_rates = np.full(len(values), np.nan)
+    np.divide(curr - prev, prev, out=growth_rates[periods:], where=prev != 0)
+    growth_rates[periods:] *= 100
     
     return growth_rates
 
@@ -334,4 +439,7 @@ def calculate_moving_average(data, window=3):
     if len(data) < window:
         return data
     
-    return np.convolve(data, np.ones(window) / window, mode='valid')
+    # Sliding window via differences of a cumulative sum: O(n) regardless of
+    # the window size, where convolve is O(n * window)
+    cumsum = np.concatenate(([0.0], np.cumsum(data, dtype=np.float64)))
+    return (cumsum[window:] - cumsum[:-window]) / window
@@ -6,10 +6,60 @@ Functions for creating charts and maps
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 import config
 
 
-def create_line_chart(data, x, y, color=None, title='', x_label='', y_label='', **kwargs):
+def _render_mode(use_webgl):
+    """Map the use_webgl flag onto plotly express' render_mode"""
+    
+    # 'auto' lets plotly express switch to WebGL (scattergl) above ~1000 points
+    if use_webgl is None:
+        return 'auto'
+    return 'webgl' if use_webgl else 'svg'
+
+
+def _density_scatter(data, x, y, title=''):
+    """
+    Bin a large point cloud into a 2-D count grid and draw it as a heatmap
+    
+    The aggregation happens here rather than in the browser, so the figure
+    carries a fixed-size grid instead of one marker per row.
+    
+    Args:
+        data (pd.DataFrame): Input data
+        x (str): Column for x-axis
+        y (str): Column for y-axis
+        title (str): Chart title
+    
+    Returns:
+        plotly.graph_objs.Figure: Heatmap of point counts
+    """
+    
+    points = data[[x, y]].dropna()
+    counts, x_edges, y_edges = np.histogram2d(
+        points[x].to_numpy(dtype=np.float64),
+        points[y].to_numpy(dtype=np.float64),
+        bins=config.SCATTER_DENSITY_BINS
+    )
+    
+    # Empty bins are left transparent; histogram2d counts are indexed [x, y]
+    counts[counts == 0] = np.nan
+    
+    return go.Figure(
+        data=go.Heatmap(
+            z=counts.T,
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            colorscale='Viridis',
+            colorbar=dict(title='Count'),
+            hovertemplate=f'{x}: %{{x:.2f}}<br>{y}: %{{y:.2f}}<br>Count: %{{z}}<extra></extra>'
+        ),
+        layout=go.Layout(title=title)
+    )
+
+
+def create_line_chart(data, x, y, color=None, title='', x_label='', y_label='', use_webgl=None, **kwargs):
     """
     Create an interactive line chart
     
@@ -21,18 +71,22 @@ def create_line_chart(data, x, y, color=None, title='', x_label='', y_label='',
         title (str): Chart title
         x_label (str): X-axis label
         y_label (str): Y-axis label
+        use_webgl (bool or None): Force WebGL (True) or SVG (False) traces;
+            None picks WebGL automatically for large data
     
     Returns:
         plotly.graph_objs.Figure: Line chart figure
     """
     
+    render_mode = _render_mode(use_webgl)
+    
     if isinstance(color, str) and color.startswith('#'):
         # Single color provided
-        fig = px.line(data, x=x, y=y, title=title, **kwargs)
+        fig = px.line(data, x=x, y=y, title=title, render_mode=render_mode, **kwargs)
         fig.update_traces(line_color=color)
     else:
         # Color by column
-        fig = px.line(data, x=x, y=y, color=color, title=title, **kwargs)
+        fig = px.line(data, x=x, y=y, color=color, title=title, render_mode=render_mode, **kwargs)
     
     fig.update_layout(
         xaxis_title=x_label,
@@ -82,7 +136,7 @@ def create_bar_chart(data, x, y, color=None, title='', x_label='', y_label='', o
     return fig
 
 
-def create_scatter_plot(data, x, y, color=None, size=None, hover_name=None, title='', x_label='', y_label='', trendline=None, **kwargs):
+def create_scatter_plot(data, x, y, color=None, size=None, hover_name=None, title='', x_label='', y_label='', trendline=None, use_webgl=None, **kwargs):
     """
     Create an interactive scatter plot
     
@@ -97,22 +151,32 @@ def create_scatter_plot(data, x, y, color=None, size=None, hover_name=None, titl
         x_label (str): X-axis label
         y_label (str): Y-axis label
         trendline (str): 'ols' for linear regression line
+        use_webgl (bool or None): Force WebGL (True) or SVG (False) markers;
+            None picks WebGL automatically for large data
+    
+    Above config.SCATTER_DENSITY_THRESHOLD rows, a plot with no color, size,
+    trendline or extra encodings is drawn as a binned count heatmap instead.
     
     Returns:
         plotly.graph_objs.Figure: Scatter plot figure
     """
     
-    fig = px.scatter(
-        data, 
-        x=x, 
-        y=y, 
-        color=color,
-        size=size,
-        hover_name=hover_name,
-        title=title,
-        trendline=trendline,
-        **kwargs
-    )
+    # Very large point clouds without per-point encodings are binned server-side
+    if len(data) > config.SCATTER_DENSITY_THRESHOLD and color is None and size is None and trendline is None and not kwargs:
+        fig = _density_scatter(data, x, y, title=title)
+    else:
+        fig = px.scatter(
+            data, 
+            x=x, 
+            y=y, 
+            color=color,
+            size=size,
+            hover_name=hover_name,
+            title=title,
+            trendline=trendline,
+            render_mode=_render_mode(use_webgl),
+            **kwargs
+        )
     
     fig.update_layout(
         xaxis_title=x_label,
@@ -3,16 +3,11 @@ Poverty Dashboard - Main Entry Point
 A comprehensive Streamlit dashboard for analyzing global and India-specific poverty data.
 """
 
+import importlib
 import streamlit as st
 from pathlib import Path
-import sys
-
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 from components.sidebar import render_sidebar
-from pages import dashboard, global_trends, rural_vs_urban, analysis, visualization, reports, learn_more
 import config
 
 # Page configuration
@@ -24,12 +19,19 @@ st.set_page_config(
 )
 
 # Load custom CSS
+@st.cache_data
+def _load_css_text(path: str) -> str:
+    """Read the stylesheet once; subsequent reruns reuse the cached text"""
+    css_path = Path(path)
+    return css_path.read_text() if css_path.exists() else ""
+
+
 def load_css():
     """Load custom CSS styles"""
-    css_path = project_root / "assets" / "css" / "style.css"
-    if css_path.exists():
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    css_path = Path(__file__).parent / "assets" / "css" / "style.css"
+    css = _load_css_text(str(css_path))
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 load_css()
 
@@ -47,21 +49,27 @@ def main():
     # Update current page in session state
     st.session_state.current_page = page_selection
     
-    # Page routing
-    if page_selection == "Dashboard":
-        dashboard.render(filters)
-    elif page_selection == "Global Trends":
-        global_trends.render(filters)
-    elif page_selection == "Rural vs Urban":
-        rural_vs_urban.render(filters)
-    elif page_selection == "Statistical Analysis":
-        analysis.render(filters)
-    elif page_selection == "Visualization":
-        visualization.render(filters)
-    elif page_selection == "Reports":
-        reports.render(filters)
-    elif page_selection == "Learn More":
-        learn_more.render()
+    # Page routing - modules are imported on demand so a rerun only
+    # loads the page being viewed (and its plotting/ML dependencies)
+    page_modules = {
+        "Dashboard": "dashboard",
+        "Global Trends": "global_trends",
+        "Rural vs Urban": "rural_vs_urban",
+        "Statistical Analysis": "analysis",
+        "Visualization": "visualization",
+        "Reports": "reports",
+        "Learn More": "learn_more",
+    }
+    
+    slug = page_modules.get(page_selection)
+    if slug is None:
+        return
+    
+    page = importlib.import_module(f"pages.{slug}")
+    if slug == "learn_more":
+        page.render()
+    else:
+        page.render(filters)
 
 
 if __name__ == "__main__":
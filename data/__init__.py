@@ -3,6 +3,12 @@ Data module for Poverty Dashboard
 Handles data fetching, caching, and preprocessing
 """
 
+import pandas as pd
+
+# Copy-on-write: derived frames share memory with their parent until one of
+# them is modified, so the preprocessing steps need no defensive df.copy()
+pd.options.mode.copy_on_write = True
+
 from .wb_api import fetch_wb_poverty_data
 from .india_poverty_api import fetch_india_poverty_data
 from .data_loader import load_data, get_cached_data
@@ -0,0 +1,101 @@
+"""
+Canonical Cached Loaders
+Page-facing helpers that normalize arguments before hitting the cache,
+so every page asking for the same data shares one cache entry
+"""
+
+import streamlit as st
+from .data_loader import load_clean_data
+import config
+
+
+def get_wb_poverty(year_range, indicator_code='SI.POV.DDAY'):
+    """
+    Cleaned World Bank poverty data for a year range
+    
+    Args:
+        year_range (tuple): (start_year, end_year)
+        indicator_code (str): World Bank indicator code
+    
+    Returns:
+        pd.DataFrame: Cleaned poverty data
+    """
+    
+    start_year, end_year = year_range
+    return load_clean_data(
+        'wb_poverty',
+        indicator_code=indicator_code,
+        start_year=start_year,
+        end_year=end_year
+    )
+
+
+def get_india_poverty(year_range, states=None, area_type='All'):
+    """
+    Cleaned India state-wise poverty data for a year range
+    
+    Args:
+        year_range (tuple): (start_year, end_year)
+        states (list): States to include (None or empty for all)
+        area_type (str): 'All', 'Rural', or 'Urban'
+    
+    Returns:
+        pd.DataFrame: Cleaned poverty data
+    """
+    
+    start_year, end_year = year_range
+    return load_clean_data(
+        'india_poverty',
+        start_year=start_year,
+        end_year=end_year,
+        states=tuple(sorted(states)) if states else None,
+        area_type=area_type
+    )
+
+
+def get_india_multi_indicator(year_range):
+    """
+    Cleaned India multi-indicator data for a year range
+    
+    Args:
+        year_range (tuple): (start_year, end_year)
+    
+    Returns:
+        pd.DataFrame: Cleaned indicator data
+    """
+    
+    start_year, end_year = year_range
+    return load_clean_data('india_multi_indicator', start_year=start_year, end_year=end_year)
+
+
+def get_yearly_mean(dataset, year_range, states=None, area_type='All'):
+    """
+    Average value per year for a poverty dataset
+    
+    Keyed on the loader arguments rather than a DataFrame, so pages that
+    plot or model the yearly average share one cached result.
+    
+    Args:
+        dataset (str): 'wb_poverty' or 'india_poverty'
+        year_range (tuple): (start_year, end_year)
+        states (list): States to include (India only; None for all)
+        area_type (str): 'All', 'Rural', or 'Urban' (India only)
+    
+    Returns:
+        pd.DataFrame: Columns [year, value]
+    """
+    
+    states = tuple(sorted(states)) if states else None
+    return _yearly_mean(dataset, tuple(year_range), states, area_type)
+
+
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=32, show_spinner=False)
+def _yearly_mean(dataset, year_range, states, area_type):
+    """Cached body of get_yearly_mean on normalized arguments"""
+    
+    if dataset == 'wb_poverty':
+        data = get_wb_poverty(year_range)
+    else:
+        data = get_india_poverty(year_range, states=states, area_type=area_type)
+    
+    return data.groupby('year')['value'].mean().reset_index()
@@ -0,0 +1,85 @@
+"""
+Persistent Parquet Cache
+Disk-backed memoization for data fetchers, kept underneath st.cache_data
+so generated/fetched frames survive process restarts
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import config
+
+logger = logging.getLogger(__name__)
+
+# Failures that mean "no usable cache file", not a bug in the wrapped function
+_CACHE_ERRORS = (OSError, pa.ArrowException)
+
+
+def parquet_cache(func):
+    """
+    Cache a DataFrame-returning function as Parquet files on disk
+    
+    The cache key is a hash of config.DISK_CACHE_VERSION, the function name
+    and its bound arguments, so bumping the version orphans every old file.
+    Files older than config.DISK_CACHE_TTL are regenerated. Reads are
+    memory-mapped and the index is stored, so a warm read returns the same
+    frame as a cold call. File-system and Parquet errors are logged and fall
+    back to calling the wrapped function directly.
+    
+    Args:
+        func (callable): Function returning a pd.DataFrame
+    
+    Returns:
+        callable: Wrapped function
+    """
+    
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        # **kwargs are folded in sorted so call-site keyword order doesn't matter
+        arguments = {
+            name: sorted(value.items()) if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD else value
+            for name, value in bound.arguments.items()
+        }
+        key = hashlib.md5(repr((config.DISK_CACHE_VERSION, sorted(arguments.items()))).encode()).hexdigest()
+        path = Path(config.DISK_CACHE_DIR) / f"{func.__name__}_{key}.parquet"
+        
+        try:
+            if time.time() - path.stat().st_mtime < config.DISK_CACHE_TTL:
+                return pd.read_parquet(path, engine='pyarrow', memory_map=True)
+        except FileNotFoundError:
+            pass
+        except _CACHE_ERRORS as e:
+            logger.warning("Disk cache read failed for %s, recomputing: %s", path, e)
+        
+        df = func(*args, **kwargs)
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Sessions are threads of one process, so the temporary name must
+            # be unique per writer, not per process; the rename is atomic
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            os.close(fd)
+            try:
+                df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except _CACHE_ERRORS as e:
+            logger.warning("Disk cache write failed for %s: %s", path, e)
+        
+        return df
+    
+    return wrapper
@@ -4,12 +4,35 @@ Placeholder functions for fetching global poverty data
 Replace with actual API calls when endpoints are available
 """
 
+import zlib
 import pandas as pd
 import numpy as np
 import streamlit as st
 import config
+from .disk_cache import parquet_cache
+
+# Seed for the synthetic draws in this module. The stream id (1) keeps them
+# independent of the India data module's draws
+_SEED = (config.ML_RANDOM_STATE, 1)
+
+
+def _rng(*key):
+    """
+    Seeded generator for one call, derived from the module seed and the call's arguments
+    
+    A fresh generator per call keeps the output reproducible regardless of
+    call order or cache state, and avoids sharing one np.random.Generator
+    (not thread-safe) across the concurrent loaders. Non-integer key parts
+    (codes, names) enter the seed through their CRC32.
+    """
+    
+    entropy = [k if isinstance(k, (int, np.integer)) else zlib.crc32(str(k).encode()) for k in key]
+    
+    return np.random.default_rng([*_SEED, *entropy])
+
 
 @st.cache_data(ttl=config.CACHE_TTL)
+@parquet_cache
 def fetch_wb_poverty_data(indicator_code, start_year=None, end_year=None, countries=None):
     """
     Fetch World Bank poverty indicator data
@@ -22,6 +45,7 @@ def fetch_wb_poverty_data(indicator_code, start_year=None, end_year=None, countr
     
     Returns:
         pd.DataFrame: Poverty data with columns [country, year, value, indicator]
+            (use data.data_loader.with_country_names for display names)
     
     TODO: Replace with actual World Bank API call:
         url = f"{config.WB_API_BASE_URL}/country/all/indicator/{indicator_code}"
@@ -31,6 +55,27 @@ def fetch_wb_poverty_data(indicator_code, start_year=None, end_year=None, countr
     """
     
     # Placeholder: Generate synthetic data
+    values, countries_list, years = _generate_wb_block(start_year, end_year, countries, indicator=indicator_code)
+    
+    return _build_wb_frame(values[0], countries_list, years, indicator_code)
+
+
+def _generate_wb_block(start_year=None, end_year=None, countries=None, n_blocks=1, indicator=None):
+    """
+    Generate synthetic country-wise values for one or more indicators
+    
+    Args:
+        start_year (int): Start year for data range
+        end_year (int): End year for data range
+        countries (list): List of country codes (ISO-3)
+        n_blocks (int): Number of independent indicator blocks to draw
+        indicator (str): Indicator code, part of the seed so indicators differ
+    
+    Returns:
+        tuple: (values, countries_list, years) where values has shape
+            (n_blocks, n_countries, n_years)
+    """
+    
     start_year = start_year or config.DATA_START_YEAR
     end_year = end_year or config.DATA_END_YEAR
     
@@ -40,26 +85,38 @@ def fetch_wb_poverty_data(indicator_code, start_year=None, end_year=None, countr
         'IRN', 'TUR', 'COD', 'THA', 'GBR', 'FRA', 'ITA', 'ZAF', 'KEN'
     ]
     
-    years = list(range(start_year, end_year + 1))
-    data = []
-    
-    for country in countries_list:
-        base_value = np.random.uniform(5, 40)  # Base poverty rate
-        trend = np.random.uniform(-0.5, 0.3)  # Yearly trend
-        
-        for i, year in enumerate(years):
-            value = base_value + (trend * i) + np.random.normal(0, 2)
-            value = max(0, min(100, value))  # Clamp between 0-100
-            
-            data.append({
-                'country': country,
-                'country_name': f"Country {country}",
-                'year': year,
-                'value': round(value, 2),
-                'indicator': indicator_code
-            })
-    
-    return pd.DataFrame(data)
+    years = np.arange(start_year, end_year + 1)
+    shape = (n_blocks, len(countries_list))
+    rng = _rng(start_year, end_year, n_blocks, indicator, '|'.join(countries_list))
+    
+    base_value = rng.uniform(5, 40, shape)  # Base poverty rate
+    trend = rng.uniform(-0.5, 0.3, shape)  # Yearly trend
+    
+    # Accumulate trend and base into the noise array in place
+    values = rng.normal(0, 2, shape + (len(years),))
+    values += trend[..., None] * np.arange(len(years))
+    values += base_value[..., None]
+    np.clip(values, 0, 100, out=values)  # Clamp between 0-100
+    np.round(values, 2, out=values)
+    
+    return values, countries_list, years
+
+
+def _build_wb_frame(values, countries_list, years, indicator_code):
+    """Assemble a long-format DataFrame from one (n_countries, n_years) block"""
+    
+    n_countries, n_years = values.shape
+    
+    # Label columns are categorical: one small code per row instead of a string;
+    # numeric columns are downcast (int16 years, float32 values)
+    country = pd.Categorical(np.repeat(np.asarray(countries_list, dtype=object), n_years))
+    
+    return pd.DataFrame({
+        'country': country,
+        'year': np.tile(years.astype(np.int16), n_countries),
+        'value': values.ravel().astype(np.float32),
+        'indicator': pd.Categorical.from_codes(np.zeros(values.size, dtype=np.int8), categories=[indicator_code])
+    })
 
 
 @st.cache_data(ttl=config.CACHE_TTL)
@@ -88,7 +145,9 @@ def fetch_wb_country_metadata():
         {'country_code': 'MEX', 'name': 'Mexico', 'region': 'Latin America & Caribbean', 'income_level': 'Upper middle income'},
     ]
     
-    return pd.DataFrame(countries)
+    # Region and income level repeat across countries and are grouped/filtered
+    # on, so they are categorical like the other label columns
+    return pd.DataFrame(countries).astype({'region': 'category', 'income_level': 'category'})
 
 
 @st.cache_data(ttl=config.CACHE_TTL)
@@ -100,8 +159,12 @@ def fetch_all_wb_indicators():
         dict: Dictionary with indicator_code as key and DataFrame as value
     """
     
-    indicators_data = {}
-    for indicator in config.WB_POVERTY_INDICATORS:
-        indicators_data[indicator['code']] = fetch_wb_poverty_data(indicator['code'])
+    codes = [indicator['code'] for indicator in config.WB_POVERTY_INDICATORS]
+    
+    # One draw covers every indicator; each frame is built from a view of its block
+    values, countries_list, years = _generate_wb_block(n_blocks=len(codes))
     
-    return indicators_data
+    return {
+        code: _build_wb_frame(values[i], countries_list, years, code)
+        for i, code in enumerate(codes)
+    }
@@ -1,9 +1,10 @@
 """
 Pages module for Poverty Dashboard
 Contains all main application pages
-"""
 
-from . import dashboard, global_trends, rural_vs_urban, analysis, visualization, reports, learn_more
+Page modules are imported lazily by app.py (importlib) so that only the
+selected page and its dependencies are loaded on each rerun.
+"""
 
 __all__ = [
     'dashboard',
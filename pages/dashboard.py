@@ -4,8 +4,10 @@ Dashboard Page - Overview with KPIs and Highlights
 
 import streamlit as st
 import pandas as pd
-from data.data_loader import load_data
-from data.preprocess import filter_data, clean_data
+import numpy as np
+from data.data_loader import with_country_names
+from data.cached_loaders import get_wb_poverty, get_india_poverty, get_yearly_mean
+from data.preprocess import filter_data, latest_year_slice
 from components.metrics import render_kpi_cards
 from utils.visualization import create_line_chart, create_bar_chart
 import config
@@ -19,24 +21,17 @@ def render(filters):
     
     # Load data
     with st.spinner("Loading data..."):
-        wb_data = load_data(
-            'wb_poverty',
-            indicator_code='SI.POV.DDAY',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1]
-        )
+        wb_data = with_country_names(get_wb_poverty(filters['year_range']))
         
-        india_data = load_data(
-            'india_poverty',
-            start_year=filters['year_range'][0],
-            end_year=filters['year_range'][1],
+        india_data = get_india_poverty(
+            filters['year_range'],
             states=filters.get('states'),
             area_type=filters.get('area_type', 'All')
         )
     
-    # Clean data
-    wb_data = clean_data(wb_data)
-    india_data = clean_data(india_data)
+    # Latest-year slices, shared by the highlights and the recent-data tables
+    _, wb_latest = latest_year_slice(wb_data)
+    _, india_latest = latest_year_slice(india_data)
     
     # Calculate KPIs
     st.subheader("📈 Key Performance Indicators")
@@ -53,7 +48,7 @@ def render(filters):
         st.subheader("🌍 Global Poverty Trends")
         if not wb_data.empty:
             # Aggregate global data by year
-            global_trend = wb_data.groupby('year')['value'].mean().reset_index()
+            global_trend = get_yearly_mean('wb_poverty', filters['year_range'])
             fig = create_line_chart(
                 global_trend,
                 x='year',
@@ -70,7 +65,12 @@ def render(filters):
         st.subheader("🇮🇳 India Poverty Trends")
         if not india_data.empty:
             # Aggregate India data by year
-            india_trend = india_data.groupby('year')['value'].mean().reset_index()
+            india_trend = get_yearly_mean(
+                'india_poverty',
+                filters['year_range'],
+                states=filters.get('states'),
+                area_type=filters.get('area_type', 'All')
+            )
             fig = create_line_chart(
                 india_trend,
                 x='year',
@@ -88,7 +88,7 @@ def render(filters):
     
     # Highlights section
     st.subheader("💡 Key Insights")
-    render_highlights(wb_data, india_data, filters)
+    render_highlights(wb_latest, india_latest)
     
     # Recent data table
     st.markdown("---")
@@ -98,10 +98,10 @@ def render(filters):
     
     with tab1:
         if not wb_data.empty:
-            recent_year = wb_data['year'].max()
-            recent_data = wb_data[wb_data['year'] == recent_year].sort_values('value', ascending=False)
+            # Partial selection of the top rows rather than a full sort
+            recent_data = wb_latest.nlargest(20, 'value')
             st.dataframe(
-                recent_data[['country_name', 'year', 'value']].head(20),
+                recent_data[['country_name', 'year', 'value']],
                 use_container_width=True,
                 hide_index=True
             )
@@ -110,10 +110,9 @@ def render(filters):
     
     with tab2:
         if not india_data.empty:
-            recent_year = india_data['year'].max()
-            recent_data = india_data[india_data['year'] == recent_year].sort_values('value', ascending=False)
+            recent_data = india_latest.nlargest(20, 'value')
             st.dataframe(
-                recent_data[['state', 'area_type', 'year', 'value']].head(20),
+                recent_data[['state', 'area_type', 'year', 'value']],
                 use_container_width=True,
                 hide_index=True
             )
@@ -121,8 +120,14 @@ def render(filters):
             st.info("No data available")
 
 
-def calculate_kpis(wb_data, india_data, filters):
-    """Calculate key performance indicators"""
+@st.cache_data(ttl=config.CACHE_TTL, max_entries=16, show_spinner=False)
+def calculate_kpis(wb_data, india_data, _filters):
+    """
+    Calculate key performance indicators
+    
+    Cached on the two frames; _filters is already reflected in them and is
+    excluded from the cache key.
+    """
     
     kpis = {
         'global_avg': 0,
@@ -133,81 +138,78 @@ def calculate_kpis(wb_data, india_data, filters):
         'total_states': 0
     }
     
+    # One groupby per dataset gives every yearly average needed below
     if not wb_data.empty:
-        latest_year = wb_data['year'].max()
-        kpis['global_avg'] = wb_data[wb_data['year'] == latest_year]['value'].mean()
+        yearly = wb_data.groupby('year', sort=True)['value'].mean()
+        latest_year = yearly.index[-1]
+        kpis['global_avg'] = yearly.iloc[-1]
         kpis['total_countries'] = wb_data['country'].nunique()
         
         # Calculate year-over-year change
-        if latest_year > wb_data['year'].min():
-            prev_year = latest_year - 1
-            if prev_year in wb_data['year'].values:
-                prev_avg = wb_data[wb_data['year'] == prev_year]['value'].mean()
-                kpis['global_change'] = ((kpis['global_avg'] - prev_avg) / prev_avg) * 100
+        prev_year = latest_year - 1
+        if prev_year in yearly.index:
+            prev_avg = yearly.loc[prev_year]
+            kpis['global_change'] = ((kpis['global_avg'] - prev_avg) / prev_avg) * 100
     
     if not india_data.empty:
-        latest_year = india_data['year'].max()
-        kpis['india_avg'] = india_data[india_data['year'] == latest_year]['value'].mean()
+        yearly = india_data.groupby('year', sort=True)['value'].mean()
+        latest_year = yearly.index[-1]
+        kpis['india_avg'] = yearly.iloc[-1]
         kpis['total_states'] = india_data['state'].nunique()
         
         # Calculate year-over-year change
-        if latest_year > india_data['year'].min():
-            prev_year = latest_year - 1
-            if prev_year in india_data['year'].values:
-                prev_avg = india_data[india_data['year'] == prev_year]['value'].mean()
-                kpis['india_change'] = ((kpis['india_avg'] - prev_avg) / prev_avg) * 100
+        prev_year = latest_year - 1
+        if prev_year in yearly.index:
+            prev_avg = yearly.loc[prev_year]
+            kpis['india_change'] = ((kpis['india_avg'] - prev_avg) / prev_avg) * 100
     
     return kpis
 
 
-def render_highlights(wb_data, india_data, filters):
-    """Render key highlights and insights"""
+def render_highlights(wb_latest, india_latest):
+    """
+    Render key highlights and insights
+    
+    Args:
+        wb_latest (pd.DataFrame): Global data for the latest year
+        india_latest (pd.DataFrame): India data for the latest year
+    """
     
     insights = []
     
-    # Global insights
-    if not wb_data.empty:
-        latest_year = wb_data['year'].max()
-        latest_data = wb_data[wb_data['year'] == latest_year]
-        
-        highest_country = latest_data.nlargest(1, 'value')
-        lowest_country = latest_data.nsmallest(1, 'value')
-        
-        if not highest_country.empty:
-            insights.append(
-                f"🔴 **Highest global poverty rate**: {highest_country.iloc[0]['country_name']} "
-                f"({highest_country.iloc[0]['value']:.2f}%)"
-            )
+    # Global insights (single argmax/argmin pass instead of partial sorts)
+    if wb_latest['value'].notna().any():
+        highest_country = wb_latest.loc[wb_latest['value'].idxmax()]
+        lowest_country = wb_latest.loc[wb_latest['value'].idxmin()]
         
-        if not lowest_country.empty:
-            insights.append(
-                f"🟢 **Lowest global poverty rate**: {lowest_country.iloc[0]['country_name']} "
-                f"({lowest_country.iloc[0]['value']:.2f}%)"
-            )
+        insights.append(
+            f"🔴 **Highest global poverty rate**: {highest_country['country_name']} "
+            f"({highest_country['value']:.2f}%)"
+        )
+        insights.append(
+            f"🟢 **Lowest global poverty rate**: {lowest_country['country_name']} "
+            f"({lowest_country['value']:.2f}%)"
+        )
     
     # India insights
-    if not india_data.empty:
-        latest_year = india_data['year'].max()
-        latest_data = india_data[india_data['year'] == latest_year]
-        
-        highest_state = latest_data.nlargest(1, 'value')
-        lowest_state = latest_data.nsmallest(1, 'value')
-        
-        if not highest_state.empty:
+    if not india_latest.empty:
+        if india_latest['value'].notna().any():
+            highest_state = india_latest.loc[india_latest['value'].idxmax()]
+            lowest_state = india_latest.loc[india_latest['value'].idxmin()]
+            
             insights.append(
-                f"🔴 **Highest India poverty rate**: {highest_state.iloc[0]['state']} "
-                f"({highest_state.iloc[0]['area_type']}) - {highest_state.iloc[0]['value']:.2f}%"
+                f"🔴 **Highest India poverty rate**: {highest_state['state']} "
+                f"({highest_state['area_type']}) - {highest_state['value']:.2f}%"
             )
-        
-        if not lowest_state.empty:
             insights.append(
-                f"🟢 **Lowest India poverty rate**: {lowest_state.iloc[0]['state']} "
-                f"({lowest_state.iloc[0]['area_type']}) - {lowest_state.iloc[0]['value']:.2f}%"
+                f"🟢 **Lowest India poverty rate**: {lowest_state['state']} "
+                f"({lowest_state['area_type']}) - {lowest_state['value']:.2f}%"
             )
         
         # Rural vs Urban insight
-        rural_avg = latest_data[latest_data['area_type'] == 'Rural']['value'].mean()
-        urban_avg = latest_data[latest_data['area_type'] == 'Urban']['value'].mean()
+        area_means = india_latest.groupby('area_type', observed=True)['value'].mean()
+        rural_avg = area_means.get('Rural', np.nan)
+        urban_avg = area_means.get('Urban', np.nan)
         
         if rural_avg > urban_avg:
             diff = rural_avg - urban_avg
@@ -12,6 +12,8 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
+import numpy as np
+from data.preprocess import latest_year_slice
 import config
 
 
@@ -22,7 +24,8 @@ def generate_pdf_report(wb_data, india_data, config_dict):
     Args:
         wb_data (pd.DataFrame): World Bank data
         india_data (pd.DataFrame): India poverty data
-        config_dict (dict): Report configuration
+        config_dict (dict): Report configuration ('generated_on' sets the
+            printed generation date, defaulting to today)
     
     Returns:
         str: Path to generated PDF file
@@ -75,7 +78,8 @@ def generate_pdf_report(wb_data, india_data, config_dict):
     story.append(Paragraph("Poverty Dashboard Report", title_style))
     story.append(Spacer(1, 0.3*inch))
     story.append(Paragraph(f"Report Type: {config_dict.get('report_type', 'General')}", styles['Normal']))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", styles['Normal']))
+    generated_on = config_dict.get('generated_on') or datetime.now()
+    story.append(Paragraph(f"Generated: {generated_on.strftime('%B %d, %Y')}", styles['Normal']))
     story.append(Spacer(1, 0.5*inch))
     
     # Executive Summary
@@ -158,8 +162,7 @@ def generate_executive_summary(wb_data, india_data):
     summary_parts = []
     
     if not wb_data.empty:
-        latest_year = wb_data['year'].max()
-        latest_data = wb_data[wb_data['year'] == latest_year]
+        latest_year, latest_data = latest_year_slice(wb_data)
         global_avg = latest_data['value'].mean()
         
         summary_parts.append(
@@ -167,12 +170,12 @@ def generate_executive_summary(wb_data, india_data):
         )
     
     if not india_data.empty:
-        latest_year = india_data['year'].max()
-        latest_data = india_data[india_data['year'] == latest_year]
+        latest_year, latest_data = latest_year_slice(india_data)
         india_avg = latest_data['value'].mean()
         
-        rural_avg = latest_data[latest_data['area_type'] == 'Rural']['value'].mean()
-        urban_avg = latest_data[latest_data['area_type'] == 'Urban']['value'].mean()
+        area_means = latest_data.groupby('area_type', observed=True)['value'].mean()
+        rural_avg = area_means.get('Rural', np.nan)
+        urban_avg = area_means.get('Urban', np.nan)
         
         summary_parts.append(
             f"India average poverty rate in {latest_year}: {india_avg:.2f}%. "
@@ -189,8 +192,7 @@ def generate_global_stats_table(wb_data):
     if wb_data.empty:
         return Paragraph("No global data available", getSampleStyleSheet()['Normal'])
     
-    latest_year = wb_data['year'].max()
-    latest_data = wb_data[wb_data['year'] == latest_year]
+    _, latest_data = latest_year_slice(wb_data)
     
     data = [
         ['Metric', 'Value'],
@@ -222,8 +224,7 @@ def generate_india_stats_table(india_data):
     if india_data.empty:
         return Paragraph("No India data available", getSampleStyleSheet()['Normal'])
     
-    latest_year = india_data['year'].max()
-    latest_data = india_data[india_data['year'] == latest_year]
+    _, latest_data = latest_year_slice(india_data)
     
     rural_data = latest_data[latest_data['area_type'] == 'Rural']
     urban_data = latest_data[latest_data['area_type'] == 'Urban']
@@ -290,21 +291,20 @@ def generate_insights(wb_data, india_data):
     insights = []
     
     if not wb_data.empty:
-        latest_year = wb_data['year'].max()
-        latest_data = wb_data[wb_data['year'] == latest_year]
+        _, latest_data = latest_year_slice(wb_data)
         
-        highest = latest_data.nlargest(1, 'value')
-        if not highest.empty:
+        if latest_data['value'].notna().any():
+            highest = latest_data.loc[latest_data['value'].idxmax()]
             insights.append(
-                f"Highest global poverty rate: {highest.iloc[0]['country_name']} ({highest.iloc[0]['value']:.2f}%)"
+                f"Highest global poverty rate: {highest['country_name']} ({highest['value']:.2f}%)"
             )
     
     if not india_data.empty:
-        latest_year = india_data['year'].max()
-        latest_data = india_data[india_data['year'] == latest_year]
+        _, latest_data = latest_year_slice(india_data)
         
-        rural_avg = latest_data[latest_data['area_type'] == 'Rural']['value'].mean()
-        urban_avg = latest_data[latest_data['area_type'] == 'Urban']['value'].mean()
+        area_means = latest_data.groupby('area_type', observed=True)['value'].mean()
+        rural_avg = area_means.get('Rural', np.nan)
+        urban_avg = area_means.get('Urban', np.nan)
         
         insights.append(
             f"Rural-urban poverty gap in India: {rural_avg - urban_avg:.2f} percentage points"